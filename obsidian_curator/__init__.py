@@ -4,12 +4,18 @@ __version__ = "0.1.0"
 __author__ = "Jose Cordovilla"
 __email__ = "jose@example.com"
 
+from importlib import import_module
+
 from .core import ObsidianCurator
 from .models import Note, CurationResult, Theme, CurationConfig
-from .ai_analyzer import AIAnalyzer
-from .content_processor import ContentProcessor
-from .theme_classifier import ThemeClassifier
-from .vault_organizer import VaultOrganizer
+
+# Heavier components are imported on first access
+_LAZY_EXPORTS = {
+    "AIAnalyzer": ".ai_analyzer",
+    "ContentProcessor": ".content_processor",
+    "ThemeClassifier": ".theme_classifier",
+    "VaultOrganizer": ".vault_organizer",
+}
 
 __all__ = [
     "ObsidianCurator",
@@ -22,3 +28,12 @@ __all__ = [
     "ThemeClassifier",
     "VaultOrganizer",
 ]
+
+
+def __getattr__(name: str):
+    """Import lazily exported components on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,9 @@
 """AI-powered content analysis using Ollama."""
 
 import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -8,6 +11,93 @@ import ollama
 from loguru import logger
 
 from .models import Note, QualityScore, Theme, ContentStructure, CurationConfig
+from .analysis_cache import FALLBACK_REASON_MARKER
+
+# Scoring rubric shared by the single-note and batched quality prompts
+_QUALITY_SCALE = """Assess each dimension on a 0.0-1.0 scale where:
+- 0.0-0.3: Poor quality, not suitable for professional use
+- 0.4-0.6: Average quality, some value but limited
+- 0.7-0.9: Good quality, suitable for professional reference
+- 0.9-1.0: Excellent quality, publication-ready"""
+
+# Instructions of the batched quality prompt; the notes follow them
+_BATCH_QUALITY_INSTRUCTIONS = f"""Analyze the QUALITY of each of the notes below for professional infrastructure/construction/governance work. Each note starts with a "=== NOTE n ===" line.
+
+{_QUALITY_SCALE}
+
+Return ONLY a JSON object with one entry per note, in the same order, in this exact format (no other text):
+{{
+    "results": [
+        {{
+            "note": 1,
+            "overall": 0.7,
+            "relevance": 0.8,
+            "completeness": 0.6,
+            "credibility": 0.7,
+            "clarity": 0.8,
+            "analytical_depth": 0.6,
+            "evidence_quality": 0.7,
+            "critical_thinking": 0.5,
+            "argument_structure": 0.6,
+            "practical_value": 0.7
+        }}
+    ]
+}}
+
+Rules:
+- Score every note independently, with exactly one entry per note
+- Be honest about quality - don't inflate scores
+- All scores must be numbers between 0.0 and 1.0
+- Consider the content's actual value to infrastructure professionals
+- Provide ONLY the JSON object, no other text whatsoever"""
+
+
+# Deletes control characters (other than newlines and tabs) from model responses
+_CONTROL_CHARS_TABLE = dict.fromkeys(c for c in range(32) if chr(c) not in '\n\r\t')
+
+# Markers used by the heuristic quality fallback
+_STRUCTURE_MARKERS = ('##', '###', '**', '- ')
+_PROFESSIONAL_WORDS = ('analysis', 'research', 'study', 'report', 'findings', 'project',
+                       'development', 'management', 'infrastructure', 'construction')
+_CITATION_PREFIXES = ('http', 'www', 'doi:', 'arxiv:')
+_CITATION_SOURCES = ('icex', 'rand', 'eleconomista')
+# Whole words only (plurals included), so e.g. 'rand' no longer matches
+# 'brand' or 'random'
+_PROFESSIONAL_LANGUAGE_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _PROFESSIONAL_WORDS)) + r')(?:s|es)?\b')
+_CITATION_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _CITATION_PREFIXES)) + r')'
+    r'|\b(?:' + '|'.join(map(re.escape, _CITATION_SOURCES)) + r')\b')
+_DATA_MARKERS = ('%', 'million', 'billion', 'data', 'statistics', '2014', '2019', '2020',
+                 '2021', '2022', '2023', '2024', '2025')
+
+# Theme keywords (and the confidence cap) used by the heuristic theme fallback
+_HEURISTIC_THEMES: Dict[str, Dict[str, Any]] = {
+    "Infrastructure Development": {
+        "keywords": ["infrastructure", "highway", "road", "bridge", "transportation", "public works", "construction projects"],
+        "confidence": 0.7
+    },
+    "Public-Private Partnerships": {
+        "keywords": ["ppp", "public-private partnership", "concession", "privatization", "public sector", "private sector"],
+        "confidence": 0.8
+    },
+    "Construction Management": {
+        "keywords": ["construction", "building", "project management", "engineering", "contractor", "building site"],
+        "confidence": 0.7
+    },
+    "Economic Policy": {
+        "keywords": ["economic", "policy", "government", "regulation", "finance", "investment", "funding"],
+        "confidence": 0.6
+    },
+    "Urban Planning": {
+        "keywords": ["urban", "city", "planning", "development", "zoning", "municipal", "metropolitan"],
+        "confidence": 0.6
+    },
+    "Technology Systems": {
+        "keywords": ["technology", "software", "system", "digital", "automation", "technical", "programming"],
+        "confidence": 0.5
+    }
+}
 
 
 class AIAnalyzer:
@@ -21,6 +111,10 @@ class AIAnalyzer:
         """
         self.config = config
         self.model = config.ai_model  # Default/fallback model
+        # Runs a note's quality and theme analyses alongside its structure
+        # analysis; created on first use and shut down by close()
+        self._subtask_executor: Optional[ThreadPoolExecutor] = None
+        self._subtask_lock = threading.Lock()
         
         # Test connection to Ollama and validate models
         try:
@@ -53,6 +147,24 @@ class AIAnalyzer:
             logger.error(f"Failed to connect to Ollama: {e}")
             raise
 
+    def _get_subtask_executor(self) -> ThreadPoolExecutor:
+        """Return the sub-analysis thread pool, creating it if needed."""
+        with self._subtask_lock:
+            if self._subtask_executor is None:
+                self._subtask_executor = ThreadPoolExecutor(max_workers=2 * self.config.max_workers,
+                                                            thread_name_prefix="ai-analysis")
+            return self._subtask_executor
+    
+    def close(self) -> None:
+        """Shut down the sub-analysis threads.
+        
+        The analyzer stays usable; a new pool is created on the next analysis.
+        """
+        with self._subtask_lock:
+            executor, self._subtask_executor = self._subtask_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
     def _get_model_for_task(self, task: str) -> str:
         """Get the optimal model for a specific task.
         
@@ -91,7 +203,7 @@ class AIAnalyzer:
             content = response["message"]["content"].strip()
             
             # Debug: Log the raw response for troubleshooting
-            logger.info(f"Ollama response length: {len(content)} chars")
+            logger.debug(f"Ollama response length: {len(content)} chars")
             logger.debug(f"Raw Ollama response: {repr(content)}")
             
             # Handle empty responses
@@ -100,7 +212,7 @@ class AIAnalyzer:
                 return {}
             
             # Clean up potential control characters
-            content = ''.join(char for char in content if ord(char) >= 32 or char in '\n\r\t')
+            content = content.translate(_CONTROL_CHARS_TABLE)
             
             # Try to extract JSON if response contains extra text
             if '{' in content and '}' in content:
@@ -142,10 +254,10 @@ class AIAnalyzer:
     def _extract_fallback_data(self, content: str) -> Any:
         """Extract basic data when JSON parsing completely fails."""
         try:
-            # Try to extract basic theme information from text
-            if "theme" in content.lower() or "themes" in content.lower():
+            # Try to extract basic theme information from text ("theme" also
+            # matches "themes")
+            if "theme" in content.lower():
                 # Extract theme names that might be mentioned
-                import re
                 theme_matches = re.findall(r'["\']([^"\']*(?:infrastructure|construction|governance|policy|technical|strategic)[^"\']*)["\']', content, re.IGNORECASE)
                 
                 if theme_matches:
@@ -210,27 +322,53 @@ class AIAnalyzer:
         
         return json_str
     
-    def analyze_note(self, note: Note) -> Tuple[QualityScore, List[Theme], ContentStructure, str]:
+    def analyze_note(self, note: Note,
+                     quality_scores: Optional[QualityScore] = None) -> Tuple[QualityScore, List[Theme], ContentStructure, str]:
         """Analyze a note for quality, themes, and structure.
         
         Args:
             note: Note to analyze
+            quality_scores: Quality already assessed for this note (e.g. by a batched
+                request); analyzed here when omitted
             
         Returns:
-            Tuple of (quality_scores, themes, content_structure, curation_reason)
+            Tuple of (quality_scores, themes, content_structure, curation_reason).
+            If any analysis fell back to heuristics or defaults, the reason ends
+            with a ``[fallback: ...]`` tag naming them.
         """
         try:
+            # Sub-analyses that could not use the model record themselves here
+            fallbacks: List[str] = []
+            
+            # The three analyses are independent model calls; when enabled, quality
+            # and themes run on helper threads while structure runs here
+            executor = self._get_subtask_executor() if self.config.concurrent_subanalyses else None
+            quality_future = None
+            themes_future = None
+            if executor is not None:
+                if quality_scores is None:
+                    quality_future = executor.submit(self._analyze_quality, note, fallbacks)
+                themes_future = executor.submit(self._identify_themes, note, fallbacks)
+            
+            # Analyze content structure
+            content_structure = self._analyze_structure(note, fallbacks)
+            
             # Analyze content quality
-            quality_scores = self._analyze_quality(note)
+            if quality_future is not None:
+                quality_scores = quality_future.result()
+            elif quality_scores is None:
+                quality_scores = self._analyze_quality(note, fallbacks)
             
             # Identify themes
-            themes = self._identify_themes(note)
-            
-            # Analyze content structure
-            content_structure = self._analyze_structure(note)
+            if themes_future is not None:
+                themes = themes_future.result()
+            else:
+                themes = self._identify_themes(note, fallbacks)
             
             # Determine curation reason
             curation_reason = self._determine_curation_reason(quality_scores, themes, content_structure, note)
+            if fallbacks:
+                curation_reason += f"{FALLBACK_REASON_MARKER}{', '.join(sorted(fallbacks))}]"
             
             return quality_scores, themes, content_structure, curation_reason
             
@@ -239,11 +377,31 @@ class AIAnalyzer:
             # Return default scores on failure
             return self._get_default_scores(), [], self._get_default_structure(), f"Analysis failed: {str(e)}"
     
-    def _analyze_quality(self, note: Note) -> QualityScore:
+    def analyze_notes(self, notes: List[Note]) -> List[Tuple[QualityScore, List[Theme], ContentStructure, str]]:
+        """Analyze several notes, scoring their quality in a single AI request.
+        
+        Themes and structure are still analyzed per note. Notes whose batched
+        quality scores are missing or malformed are scored individually, so one
+        bad response never fails the whole batch.
+        
+        Args:
+            notes: Notes to analyze
+            
+        Returns:
+            One (quality_scores, themes, content_structure, curation_reason) tuple per note, in order
+        """
+        if len(notes) <= 1:
+            return [self.analyze_note(note) for note in notes]
+        
+        batched_scores = self._analyze_quality_batch(notes)
+        return [self.analyze_note(note, quality_scores) for note, quality_scores in zip(notes, batched_scores)]
+    
+    def _analyze_quality(self, note: Note, fallbacks: Optional[List[str]] = None) -> QualityScore:
         """Analyze the quality of a note's content using AI.
         
         Args:
             note: Note to analyze
+            fallbacks: Gets "quality" appended if the heuristic fallback is used
             
         Returns:
             QualityScore object
@@ -277,27 +435,29 @@ class AIAnalyzer:
             return ai_result
         except Exception as e:
             logger.warning(f"AI quality analysis failed for note '{note.title}', using heuristic fallback: {e}")
+            if fallbacks is not None:
+                fallbacks.append("quality")
             logger.debug(f"Content preview: {content[:200]}...")
             heuristic_result = self._heuristic_quality_analysis(note, content)
             logger.debug(f"Heuristic quality analysis: overall={heuristic_result.overall}, relevance={heuristic_result.relevance}")
             return heuristic_result
     
-    def _ai_analyze_quality(self, note: Note, content: str) -> QualityScore:
-        """Use AI to analyze content quality."""
-        system_prompt = f"""You are an expert content quality analyst specializing in infrastructure, construction, and governance content. Use {self.config.reasoning_level} reasoning to assess content quality objectively.
+    def _quality_system_prompt(self) -> str:
+        """System prompt for quality analysis requests."""
+        return f"""You are an expert content quality analyst specializing in infrastructure, construction, and governance content. Use {self.config.reasoning_level} reasoning to assess content quality objectively.
 
 CRITICAL: You must respond with ONLY valid JSON. No explanations, no additional text, no markdown formatting. Just the JSON object."""
+    
+    def _ai_analyze_quality(self, note: Note, content: str) -> QualityScore:
+        """Use AI to analyze content quality."""
+        system_prompt = self._quality_system_prompt()
         
         prompt = f"""Analyze the QUALITY of this content for professional infrastructure/construction/governance work.
 
 Content:
 {content}
 
-Assess each dimension on a 0.0-1.0 scale where:
-- 0.0-0.3: Poor quality, not suitable for professional use
-- 0.4-0.6: Average quality, some value but limited
-- 0.7-0.9: Good quality, suitable for professional reference
-- 0.9-1.0: Excellent quality, publication-ready
+{_QUALITY_SCALE}
 
 Return ONLY a JSON object with this exact format (no other text):
 {{
@@ -328,6 +488,14 @@ Rules:
             logger.error(f"Invalid AI response for quality analysis: {type(quality_data)} - {repr(quality_data)}")
             raise ValueError("Invalid AI response for quality analysis")
         
+        return self._quality_from_data(quality_data)
+    
+    def _quality_from_data(self, quality_data: Dict[str, Any]) -> QualityScore:
+        """Build a QualityScore from the JSON scores returned by the model.
+        
+        Raises:
+            ValueError: If the scores cannot be parsed
+        """
         # Extract scores with validation
         try:
             # Debug: Log the actual values being extracted
@@ -357,15 +525,60 @@ Rules:
             logger.error(f"Raw AI response: {repr(quality_data)}")
             raise ValueError(f"Failed to parse quality scores: {e}")
     
+    def _analyze_quality_batch(self, notes: List[Note]) -> List[Optional[QualityScore]]:
+        """Score the quality of several notes with one AI request.
+        
+        Args:
+            notes: Notes to score
+            
+        Returns:
+            Quality scores per note, in order; None where the note is too short
+            for AI analysis or no usable scores came back for it
+        """
+        scores: List[Optional[QualityScore]] = [None] * len(notes)
+        excerpts = [note.content[:2000] if note.content else "" for note in notes]
+        # Short notes get fixed scores in _analyze_quality without calling the model
+        batched = [i for i, content in enumerate(excerpts) if len(content.strip()) >= 50]
+        if len(batched) < 2:
+            return scores
+        
+        system_prompt = self._quality_system_prompt()
+        
+        sections = "\n\n".join(f"=== NOTE {number} ===\n{excerpts[i]}" for number, i in enumerate(batched, 1))
+        # Fixed instructions first, so the model server can reuse its cache of
+        # the shared prompt prefix across batches
+        prompt = f"""{_BATCH_QUALITY_INSTRUCTIONS}
+
+There are {len(batched)} notes; "results" must contain exactly {len(batched)} entries.
+
+{sections}"""
+        
+        logger.debug(f"Calling AI for batched quality analysis of {len(batched)} notes")
+        quality_data = self._chat_json(system_prompt, prompt, temperature=0.1, task="quality_analysis")
+        results = quality_data.get("results") if isinstance(quality_data, dict) else None
+        if not isinstance(results, list) or len(results) != len(batched):
+            logger.warning(f"Batched quality analysis returned unusable data for {len(batched)} notes, scoring them individually")
+            return scores
+        
+        for i, item in zip(batched, results):
+            if not isinstance(item, dict):
+                continue
+            try:
+                scores[i] = self._quality_from_data(item)
+            except ValueError as e:
+                logger.debug(f"Rescoring '{notes[i].title}' individually: {e}")
+        return scores
+    
     def _heuristic_quality_analysis(self, note: Note, content: str) -> QualityScore:
         """Fallback heuristic quality analysis when AI fails."""
         # Check for obvious quality indicators
+        content_lower = content.lower()
         quality_indicators = {
-            'has_clear_structure': any(marker in content.lower() for marker in ['##', '###', '**', '- ']),
+            'has_clear_structure': any(marker in content_lower for marker in _STRUCTURE_MARKERS),
             'has_substantial_content': len(content.split()) > 100,
-            'has_professional_language': any(word in content.lower() for word in ['analysis', 'research', 'study', 'report', 'findings', 'project', 'development', 'management', 'infrastructure', 'construction']),
-            'has_citations': any(marker in content for marker in ['http', 'www', 'doi:', 'arxiv:', 'icex', 'rand', 'eleconomista']),
-            'has_data': any(marker in content for marker in ['%', 'million', 'billion', 'data', 'statistics', '2014', '2019', '2020', '2021', '2022', '2023', '2024', '2025'])
+            'has_professional_language': _PROFESSIONAL_LANGUAGE_RE.search(content_lower) is not None,
+            'has_citations': _CITATION_RE.search(content) is not None,
+            'has_data': any(marker in content for marker in _DATA_MARKERS)
         }
         
         # Calculate realistic base scores - NO ARTIFICIAL INFLATION
@@ -389,11 +602,12 @@ Rules:
             **base_scores
         )
     
-    def _identify_themes(self, note: Note) -> List[Theme]:
+    def _identify_themes(self, note: Note, fallbacks: Optional[List[str]] = None) -> List[Theme]:
         """Identify themes in the content using AI with better fallback.
         
         Args:
             note: Note to analyze
+            fallbacks: Gets "themes" appended if the heuristic fallback is used
             
         Returns:
             List of Theme objects
@@ -409,6 +623,8 @@ Rules:
             return self._ai_identify_themes(note, content)
         except Exception as e:
             logger.warning(f"AI theme analysis failed, using heuristic fallback: {e}")
+            if fallbacks is not None:
+                fallbacks.append("themes")
             return self._heuristic_theme_analysis(note, content)
     
     def _ai_identify_themes(self, note: Note, content: str) -> List[Theme]:
@@ -489,38 +705,10 @@ Rules:
     
     def _heuristic_theme_analysis(self, note: Note, content: str) -> List[Theme]:
         """Fallback heuristic theme analysis when AI fails."""
-        # Define theme keywords for pattern matching
-        theme_patterns = {
-            "Infrastructure Development": {
-                "keywords": ["infrastructure", "highway", "road", "bridge", "transportation", "public works", "construction projects"],
-                "confidence": 0.7
-            },
-            "Public-Private Partnerships": {
-                "keywords": ["ppp", "public-private partnership", "concession", "privatization", "public sector", "private sector"],
-                "confidence": 0.8
-            },
-            "Construction Management": {
-                "keywords": ["construction", "building", "project management", "engineering", "contractor", "building site"],
-                "confidence": 0.7
-            },
-            "Economic Policy": {
-                "keywords": ["economic", "policy", "government", "regulation", "finance", "investment", "funding"],
-                "confidence": 0.6
-            },
-            "Urban Planning": {
-                "keywords": ["urban", "city", "planning", "development", "zoning", "municipal", "metropolitan"],
-                "confidence": 0.6
-            },
-            "Technology Systems": {
-                "keywords": ["technology", "software", "system", "digital", "automation", "technical", "programming"],
-                "confidence": 0.5
-            }
-        }
-        
         content_lower = content.lower()
         identified_themes = []
         
-        for theme_name, pattern_info in theme_patterns.items():
+        for theme_name, pattern_info in _HEURISTIC_THEMES.items():
             keyword_matches = sum(1 for keyword in pattern_info["keywords"] if keyword in content_lower)
             if keyword_matches > 0:
                 # Calculate confidence based on keyword density
@@ -544,11 +732,12 @@ Rules:
         identified_themes.sort(key=lambda x: x.confidence, reverse=True)
         return identified_themes[:3]  # Return top 3 themes
     
-    def _analyze_structure(self, note: Note) -> ContentStructure:
+    def _analyze_structure(self, note: Note, fallbacks: Optional[List[str]] = None) -> ContentStructure:
         """Analyze content structure and logical flow using AI.
         
         Args:
             note: Note to analyze
+            fallbacks: Gets "structure" appended if the default structure is used
             
         Returns:
             ContentStructure object with structural analysis
@@ -590,7 +779,7 @@ Rules:
             # Handle empty or invalid JSON response
             if not structure_data or not isinstance(structure_data, dict):
                 logger.warning(f"Structure analysis returned invalid data: {type(structure_data)}")
-                return self._default_content_structure()
+                return self._fallback_content_structure(fallbacks)
 
             # Extract values with defaults
             try:
@@ -605,11 +794,17 @@ Rules:
                 )
             except (ValueError, TypeError) as e:
                 logger.warning(f"Failed to parse structure data: {e}")
-                return self._default_content_structure()
+                return self._fallback_content_structure(fallbacks)
             
         except Exception as e:
             logger.error(f"Failed to analyze structure: {e}")
-            return self._default_content_structure()
+            return self._fallback_content_structure(fallbacks)
+    
+    def _fallback_content_structure(self, fallbacks: Optional[List[str]]) -> ContentStructure:
+        """Default content structure used when the AI gave no usable structure."""
+        if fallbacks is not None:
+            fallbacks.append("structure")
+        return self._default_content_structure()
     
     def _default_content_structure(self) -> ContentStructure:
         """Return default content structure when AI analysis fails."""
@@ -730,7 +925,7 @@ Rules:
         results = []
         
         for i, note in enumerate(notes):
-            logger.info(f"Analyzing note {i+1}/{len(notes)}: {note.title}")
+            logger.debug(f"Analyzing note {i+1}/{len(notes)}: {note.title}")
             
             try:
                 quality_scores, themes, content_structure, curation_reason = self.analyze_note(note)
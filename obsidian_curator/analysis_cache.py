@@ -0,0 +1,351 @@
+"""Persistent cache of AI analysis results keyed by note content."""
+
+import hashlib
+import math
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel
+
+from .models import Note, QualityScore, Theme, ContentStructure, CurationConfig
+
+# Analysis tuple as returned by AIAnalyzer.analyze_note
+AnalysisResult = Tuple[QualityScore, List[Theme], ContentStructure, str]
+
+# Appended to the curation reason when a sub-analysis fell back to heuristics
+# or defaults because the model gave no usable answer
+FALLBACK_REASON_MARKER = " [fallback: "
+
+
+def used_fallback(analysis: AnalysisResult) -> bool:
+    """Check whether an analysis failed or used a fallback for any part.
+
+    Such analyses reflect a model outage rather than the note, so they are
+    never cached.
+    """
+    reason = analysis[3]
+    return reason.startswith("Analysis failed") or FALLBACK_REASON_MARKER in reason
+
+
+class CachedAnalysis(BaseModel):
+    """Serialized form of a cached analysis.
+
+    Entries are stored as JSON produced and validated by pydantic, so entries
+    written by an incompatible version fail validation and count as misses.
+    """
+    quality_scores: QualityScore
+    themes: List[Theme]
+    content_structure: Optional[ContentStructure] = None
+    curation_reason: str
+    embedding: Optional[List[float]] = None
+    stored_at: float = 0.0
+
+    @classmethod
+    def from_analysis(cls, analysis: AnalysisResult,
+                      embedding: Optional[List[float]] = None,
+                      stored_at: float = 0.0) -> "CachedAnalysis":
+        """Wrap an analysis tuple (and optionally its note's embedding and storage time)."""
+        quality_scores, themes, content_structure, curation_reason = analysis
+        return cls(quality_scores=quality_scores, themes=themes,
+                   content_structure=content_structure, curation_reason=curation_reason,
+                   embedding=embedding, stored_at=stored_at)
+
+    def to_analysis(self) -> AnalysisResult:
+        """Return the analysis tuple."""
+        return self.quality_scores, self.themes, self.content_structure, self.curation_reason
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".obsidian_curator" / "cache"
+
+
+def model_fingerprint(config: CurationConfig) -> str:
+    """Describe everything besides the note itself that shapes an analysis.
+
+    Changing any model or the reasoning level produces a different fingerprint,
+    so results from an older setup are never reused.
+    """
+    models = config.models
+    return "|".join([
+        models.content_curation,
+        models.quality_analysis,
+        models.theme_classification,
+        models.structure_analysis,
+        models.fallback,
+        config.reasoning_level,
+    ])
+
+
+def content_digest(note: Note) -> str:
+    """Hex SHA-256 of a note's content type and content."""
+    digest = hashlib.sha256()
+    digest.update(str(note.content_type.value).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((note.content or "").encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def _unit_vector(vector: List[float]) -> Optional[List[float]]:
+    """Scale a vector to unit length, or return None for a zero vector."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if not norm:
+        return None
+    return [x / norm for x in vector]
+
+
+class AnalysisCache:
+    """On-disk cache mapping note content to its AI analysis.
+
+    Entries are keyed by a SHA-256 digest of the note content (and content
+    type, which changes the analysis) plus the model fingerprint. Access is
+    serialized with a lock so the cache can be shared by analysis threads.
+
+    When ``max_entries`` is set, the least recently used entries are evicted
+    on close so the cache stays within that size.
+    """
+
+    def __init__(self, cache_dir: Path, fingerprint: str, max_entries: Optional[int] = None):
+        """Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            fingerprint: Model fingerprint mixed into every key
+            max_entries: Maximum number of entries kept (unbounded if None)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = shelve.open(str(self.cache_dir / "analysis"))
+        # Last-use time per key, persisted separately so hits never rewrite entries
+        self._access = shelve.open(str(self.cache_dir / "analysis_access"))
+        self._used: Dict[str, float] = {}
+
+    def key_for(self, note: Note) -> str:
+        """Build the cache key for a note."""
+        return f"{content_digest(note)}:{self.fingerprint}"
+
+    def get(self, note: Note) -> Optional[AnalysisResult]:
+        """Return the cached analysis for a note, or None on a miss."""
+        key = self.key_for(note)
+        with self._lock:
+            try:
+                raw = self._db.get(key)
+                entry = CachedAnalysis.model_validate_json(raw).to_analysis() if raw is not None else None
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable analysis cache entry: {e}")
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._used[key] = time.time()
+        return entry
+
+    def set(self, note: Note, analysis: AnalysisResult) -> None:
+        """Store the analysis for a note."""
+        key = self.key_for(note)
+        raw = CachedAnalysis.from_analysis(analysis).model_dump_json()
+        with self._lock:
+            self._db[key] = raw
+            self._used[key] = time.time()
+
+    def close(self) -> None:
+        """Record entry use, evict entries beyond ``max_entries`` and close the store."""
+        with self._lock:
+            try:
+                for key, used_at in self._used.items():
+                    self._access[key] = used_at
+                if self.max_entries is not None:
+                    self._evict_least_recently_used()
+            except Exception as e:
+                logger.warning(f"Failed to update analysis cache usage: {e}")
+            self._access.close()
+            self._db.close()
+
+    def _evict_least_recently_used(self) -> None:
+        """Delete the least recently used entries beyond ``max_entries``."""
+        excess = len(self._db) - self.max_entries
+        if excess <= 0:
+            return
+        # Entries never recorded as used (e.g. from older versions) go first
+        oldest = sorted(self._db.keys(), key=lambda key: self._access.get(key, 0.0))[:excess]
+        for key in oldest:
+            del self._db[key]
+            if key in self._access:
+                del self._access[key]
+        logger.info(f"Evicted {len(oldest)} least recently used analysis cache entries")
+
+    def log_stats(self) -> None:
+        """Log hit/miss counts for this run."""
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"Analysis cache: {self.hits} hits, {self.misses} misses "
+                        f"({self.hits / total * 100:.1f}% hit rate)")
+
+
+class SemanticAnalysisCache:
+    """Reuses analyses of near-duplicate notes via embedding similarity.
+
+    Web clippings of the same article captured twice rarely hash the same but
+    embed almost identically. Each analyzed note's embedding is stored with its
+    analysis; a new note whose cosine similarity to a stored embedding reaches
+    ``threshold`` reuses that analysis instead of calling the LLM.
+
+    Lookups scan every stored embedding in pure Python, so their cost grows
+    with the number of entries. ``max_entries`` bounds that: once exceeded,
+    the oldest stored entries are dropped.
+    """
+
+    # Characters embedded per note; matches the excerpt the analyzer looks at
+    EMBED_CHARS = 2000
+    # Similarity at which a stored note counts as the same content; no better match can follow
+    EXACT_MATCH_SIMILARITY = 0.9999
+
+    def __init__(self, cache_dir: Path, fingerprint: str, embedding_model: str, threshold: float,
+                 max_entries: Optional[int] = None):
+        """Open (or create) the semantic cache and load stored embeddings.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            fingerprint: Model fingerprint; entries from other setups are ignored
+            embedding_model: Ollama model used to embed note content
+            threshold: Minimum cosine similarity for reusing an analysis
+            max_entries: Maximum number of entries kept (unbounded if None)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.fingerprint = f"{fingerprint}|{embedding_model}"
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._db = shelve.open(str(self.cache_dir / "semantic"))
+        loaded: List[Tuple[float, str, List[float], AnalysisResult]] = []
+        for key in self._db.keys():
+            if key.endswith(f":{self.fingerprint}"):
+                try:
+                    entry = CachedAnalysis.model_validate_json(self._db[key])
+                except Exception as e:
+                    logger.debug(f"Skipping unreadable semantic cache entry: {e}")
+                    continue
+                if entry.embedding:
+                    loaded.append((entry.stored_at, key, entry.embedding, entry.to_analysis()))
+        # Oldest first, so trimming drops the entries stored longest ago
+        loaded.sort(key=lambda item: item[0])
+        self._entries: "OrderedDict[str, Tuple[List[float], AnalysisResult]]" = OrderedDict(
+            (key, (embedding, analysis)) for _, key, embedding, analysis in loaded
+        )
+        self._trim()
+        logger.debug(f"Loaded {len(self._entries)} semantic cache entries")
+
+    def embed(self, note: Note) -> Optional[List[float]]:
+        """Embed a note's content as a unit vector, or None if embedding fails."""
+        import ollama
+        
+        text = self._embedding_text(note)
+        if not text.strip():
+            return None
+        try:
+            vector = ollama.embeddings(model=self.embedding_model, prompt=text)["embedding"]
+        except Exception as e:
+            logger.warning(f"Embedding failed for note {note.title}: {e}")
+            return None
+        return _unit_vector(vector)
+    
+    def embed_many(self, notes: List[Note]) -> List[Optional[List[float]]]:
+        """Embed several notes, in a single request when the Ollama client supports it.
+        
+        Falls back to one :meth:`embed` call per note with older clients or if
+        the batched request fails.
+        
+        Args:
+            notes: Notes to embed
+            
+        Returns:
+            Unit vectors in the same order as the notes (None where embedding failed)
+        """
+        import ollama
+        
+        texts = [self._embedding_text(note) for note in notes]
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        if len(indices) > 1 and hasattr(ollama, "embed"):
+            try:
+                response = ollama.embed(model=self.embedding_model, input=[texts[i] for i in indices])
+                vectors: List[Optional[List[float]]] = [None] * len(notes)
+                for i, vector in zip(indices, response["embeddings"]):
+                    vectors[i] = _unit_vector(vector)
+                return vectors
+            except Exception as e:
+                logger.warning(f"Batched embedding of {len(indices)} notes failed, embedding them one by one: {e}")
+        return [self.embed(note) for note in notes]
+    
+    def _embedding_text(self, note: Note) -> str:
+        """Text of a note that is embedded."""
+        return (note.content or "")[:self.EMBED_CHARS]
+    
+    def get(self, note: Note, vector: Optional[List[float]]) -> Optional[AnalysisResult]:
+        """Return the analysis of the most similar stored note above the threshold."""
+        if vector is None:
+            return None
+        with self._lock:
+            entries = list(self._entries.values())
+
+        best_score = self.threshold
+        best_analysis = None
+        for stored, analysis in entries:
+            score = sum(a * b for a, b in zip(vector, stored))
+            if score >= best_score:
+                best_score = score
+                best_analysis = analysis
+                if score >= self.EXACT_MATCH_SIMILARITY:
+                    break
+
+        if best_analysis is not None:
+            with self._lock:
+                self.hits += 1
+            logger.debug(f"Semantic cache hit for '{note.title}' (similarity {best_score:.3f})")
+        return best_analysis
+
+    def set(self, note: Note, vector: Optional[List[float]], analysis: AnalysisResult) -> None:
+        """Store an analysis together with the embedding of its note.
+
+        Args:
+            note: Analyzed note
+            vector: Unit embedding from :meth:`embed`
+            analysis: Analysis to reuse for similar notes
+        """
+        if vector is None:
+            return
+        key = f"{content_digest(note)}:{self.fingerprint}"
+        raw = CachedAnalysis.from_analysis(analysis, embedding=vector,
+                                           stored_at=time.time()).model_dump_json()
+        with self._lock:
+            self._entries[key] = (vector, analysis)
+            self._entries.move_to_end(key)
+            self._db[key] = raw
+            self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest entries beyond ``max_entries``, in memory and on disk."""
+        if self.max_entries is None:
+            return
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            try:
+                del self._db[key]
+            except KeyError:
+                pass
+
+    def close(self) -> None:
+        """Flush and close the underlying store."""
+        with self._lock:
+            self._db.close()
@@ -142,6 +142,7 @@ def cli() -> None:
 @click.option('--target-themes', help="Comma-separated list of target themes to focus on")
 @click.option('--no-clean-html', is_flag=True, help="Skip HTML cleaning")
 @click.option('--no-preserve-metadata', is_flag=True, help="Don't preserve original metadata")
+@click.option('--no-cache', is_flag=True, help="Re-run AI analysis even for notes analyzed in earlier runs")
 @click.option('--dry-run', is_flag=True, help="Show what would be done without doing it")
 @click.option('--verbose', is_flag=True, help="Enable verbose logging")
 def curate(input_path: Path, 
@@ -155,6 +156,7 @@ def curate(input_path: Path,
            target_themes: Optional[str],
            no_clean_html: bool,
            no_preserve_metadata: bool,
+           no_cache: bool,
            dry_run: bool,
            verbose: bool) -> None:
     """Curate an Obsidian vault using AI analysis.
@@ -185,7 +187,8 @@ def curate(input_path: Path,
             sample_size=sample_size,
             target_themes=target_themes_list,
             preserve_metadata=not no_preserve_metadata,
-            clean_html=not no_clean_html
+            clean_html=not no_clean_html,
+            use_cache=not no_cache
         )
         
         # Display configuration
@@ -195,7 +198,7 @@ def curate(input_path: Path,
         if dry_run:
             console.print(Panel("[yellow]DRY RUN MODE - No files will be modified[/yellow]", border_style="yellow"))
             
-            # Initialize curator to validate configuration
+            # Initialize curator (AI components are not needed for discovery)
             curator = ObsidianCurator(config)
             
             # Discover notes
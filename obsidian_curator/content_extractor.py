@@ -17,6 +17,26 @@ except ImportError:
     TESSERACT_AVAILABLE = False
     logger.warning("pytesseract not available - image OCR will be disabled")
 
+# Phrases marking short extracts as navigation/UI chrome rather than content
+_UI_INDICATORS = ('home', 'menu', 'navigation', 'contact us', 'about us', 'privacy policy', 'terms of service')
+
+# Whitespace-separated words, matched the same way as str.split()
+_WORD_RE = re.compile(r'\S+')
+
+
+def _has_unique_words(text: str, minimum: int) -> bool:
+    """Check whether *text* has at least *minimum* distinct words, ignoring case.
+    
+    Words are lowercased one at a time and scanning stops as soon as enough
+    are found, so long extracts are never copied in full.
+    """
+    seen = set()
+    for match in _WORD_RE.finditer(text):
+        seen.add(match.group().lower())
+        if len(seen) >= minimum:
+            return True
+    return False
+
 
 class ContentExtractor:
     """Extracts content from various sources including PDFs, images, and URLs."""
@@ -344,24 +364,25 @@ class ContentExtractor:
         
         for source, content in extracted_content.items():
             # Skip if content is too short or empty
-            if not content or len(content.strip()) < 50:
+            stripped = content.strip() if content else ""
+            if len(stripped) < 50:
                 continue
             
             # Skip if content appears to be metadata/headers only
-            lines = content.strip().split('\n')
-            substantive_lines = [line for line in lines if len(line.strip()) > 20]
-            if len(substantive_lines) < 2:
+            substantive_lines = sum(1 for line in stripped.split('\n') if len(line.strip()) > 20)
+            if substantive_lines < 2:
                 continue
                 
             # Skip if content is mostly repetitive
-            unique_words = set(content.lower().split())
-            if len(unique_words) < 10:
+            if not _has_unique_words(content, 10):
                 continue
                 
-            # Skip if content appears to be navigation/UI elements
-            ui_indicators = ['home', 'menu', 'navigation', 'contact us', 'about us', 'privacy policy', 'terms of service']
-            if any(indicator in content.lower() for indicator in ui_indicators) and len(content) < 200:
-                continue
+            # Skip if content appears to be navigation/UI elements (only short
+            # extracts are checked, so the length test goes first)
+            if len(content) < 200:
+                content_lower = content.lower()
+                if any(indicator in content_lower for indicator in _UI_INDICATORS):
+                    continue
                 
             # Content passes basic filters
             filtered_content[source] = content
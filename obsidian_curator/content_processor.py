@@ -1,12 +1,19 @@
 """Content processing and cleaning for Obsidian notes."""
 
+import multiprocessing
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from functools import partial
+from itertools import repeat
+from html import unescape
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from urllib.parse import urlparse
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 
 import markdown
+import yaml
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -15,6 +22,322 @@ from loguru import logger
 from .models import Note, ContentType
 from .content_extractor import ContentExtractor
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Line patterns that carry no content (used by _has_meaningful_content)
+_EMPTY_LINE_PATTERNS = [
+    r'^#+\s*$',  # Only headers
+    r'^\s*$',    # Only whitespace
+    r'^!?\[\[.*\]\]\s*$',  # Only links
+    r'^https?://.*$',  # Only URLs
+    r'^.*TODO.*$',  # TODO placeholders
+    r'^.*placeholder.*$',  # Placeholder text
+]
+
+# Web clutter line patterns (Spanish and English)
+_WEB_CLUTTER_LINE_PATTERNS = [
+    r'^Secciones$',  # Section headers
+    r'^Casa Real.*',  # Royal family section
+    r'^Madrid.*',  # Madrid section
+    r'^Sevilla.*',  # Sevilla section
+    r'^Aragón.*',  # Aragon section
+    r'^Canarias.*',  # Canary Islands section
+    r'^Castilla y León.*',  # Castile and Leon section
+    r'^Cataluña.*',  # Catalonia section
+    r'^C\. Valenciana.*',  # Valencia section
+    r'^Galicia.*',  # Galicia section
+    r'^Navarra.*',  # Navarre section
+    r'^País Vasco.*',  # Basque Country section
+    r'^Toledo.*',  # Toledo section
+    r'^Internacional.*',  # International section
+    r'^Declaración Renta.*',  # Tax declaration section
+    r'^Inmobiliario.*',  # Real estate section
+    r'^Blogs.*',  # Blogs section
+    r'^Fe De Ratas.*',  # Fe de Ratas section
+    r'^El Astrolabio.*',  # El Astrolabio section
+    r'^El Sacapuntas.*',  # El Sacapuntas section
+    r'^Real Madrid.*',  # Real Madrid section
+    r'^Atlético de Madrid.*',  # Atletico Madrid section
+    r'^Fútbol.*',  # Football section
+    r'^Baloncesto.*',  # Basketball section
+    r'^Tenis.*',  # Tennis section
+    r'^Fórmula 1.*',  # Formula 1 section
+    r'^Motos.*',  # Motorcycles section
+    r'^Náutica.*',  # Sailing section
+    r'^Ciclismo.*',  # Cycling section
+    r'^Torneo ACBNext.*',  # ACB Next tournament section
+    r'^Ciencia.*',  # Science section
+    r'^Salud.*',  # Health section
+    r'^Es Noticia$',  # It's News
+    r'^Castor.*',  # Castor news
+    r'^Presupuestos Generales.*',  # General Budget news
+    r'^Elecciones Francia.*',  # French elections news
+    r'^Cita Previa.*',  # Tax appointment news
+    r'^Regalos Día de la Madre.*',  # Mother's Day gifts news
+    r'^Venezuela.*',  # Venezuela news
+    r'^La Casa de Papel.*',  # Money Heist news
+    r'^YouTube.*',  # YouTube news
+    r'^Brexit.*',  # Brexit news
+    r'^Identifíquese$',  # Identify yourself
+    r'^Acceda a ClubABC.*',  # Access ClubABC
+    r'^Entre$',  # Enter
+    r'^¿Ha olvidado su contraseña\?$',  # Forgot password
+    r'^Regístrese$',  # Register
+    r'^Únase a ClubABC.*',  # Join ClubABC
+    r'^Regístrese ahora$',  # Register now
+    r'^Síguenos en$',  # Follow us
+    r'^_ABC\.es_$',  # ABC.es header
+]
+
+# Fused alternations so each line is matched once instead of once per pattern
+_EMPTY_LINE_RE = re.compile('|'.join(f'(?:{p})' for p in _EMPTY_LINE_PATTERNS), re.IGNORECASE)
+_WEB_CLUTTER_LINE_RE = re.compile('|'.join(f'(?:{p})' for p in _WEB_CLUTTER_LINE_PATTERNS), re.IGNORECASE)
+
+# Lowercase keywords marking article prose in _final_text_cleanup
+_ARTICLE_WORDS = [
+    'government', 'project', 'projects', 'construction', 'infrastructure',
+    'million', 'billion', 'company', 'investment'
+]
+_CONTENT_WORDS = [
+    'the', 'and', 'said', 'project', 'company', 'government', 'will', 'would',
+    'can', 'construction', 'infrastructure', 'development'
+]
+_ARTICLE_WORD_RE = re.compile('|'.join(map(re.escape, _ARTICLE_WORDS)))
+_CONTENT_WORD_RE = re.compile('|'.join(map(re.escape, _CONTENT_WORDS)))
+
+# Substring indicators used by _final_text_cleanup. Only obvious clutter is
+# removed once a line sequence looks like article content.
+_ARTICLE_SKIP_INDICATORS = [
+    'PUBLICIDAD', 'Publicidad', 'Productos Yahoo!',
+    'Más Buscados', 'Todo Sobre Los Mercados',
+    'YAHOO! FINANZAS', 'Más Yahoo! Finanzas',
+    'Correo electrónico', 'Share on', 'Back to'
+]
+
+# Enhanced clutter removal for web content
+_CLUTTER_INDICATORS = [
+    'Buscar', 'buscar', 'Search', 'search',
+    'Yahoo!', 'Copyright', 'Todos los derechos',
+    'Política de privacidad', 'Términos del Servicio',
+    'Ayuda', 'Mail', 'Inicio', 'Ver más', 'Mostrar más',
+    'Saltar a', 'Haz de Y!', 'tu página de inicio',
+    'Correo electrónico', 'Facebook', 'Twitter',
+    'Publicar como', 'Escribe un comentario',
+    'Deja un comentario', 'Aún no Hay Comentarios',
+    'PUBLICIDAD', 'Publicidad', 'Productos Yahoo!',
+    'Más Buscados', 'Todo Sobre Los Mercados',
+    'Cotizaciones recientes', 'Hoy En Yahoo!',
+    'YAHOO! FINANZAS', 'Más Yahoo! Finanzas',
+    # Additional web clutter patterns
+    'Tweet', 'Share', 'LinkedIn', 'Reddit', 'Pinterest',
+    'Read also:', 'Related articles:', 'You might also like:',
+    'Trending now:', 'Most popular:', 'Recommended for you:',
+    'Subscribe to', 'Newsletter', 'Follow us', 'Sign up',
+    'This page has been shared', 'View these Tweets',
+    'Paper Edition', 'Page:', 'Print', 'Email this',
+    'Next threat:', 'Shuttlers win', 'Undervalued',
+    'Glorious moment', 'A weekend at', 'Headlines News'
+]
+
+# Escaped alternations: one scan per line instead of one `in` test per indicator
+_ARTICLE_SKIP_INDICATOR_RE = re.compile('|'.join(map(re.escape, _ARTICLE_SKIP_INDICATORS)))
+_CLUTTER_INDICATOR_RE = re.compile('|'.join(map(re.escape, _CLUTTER_INDICATORS)))
+
+# Fallback tag stripping used when HTML cannot be parsed
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Heading tags rendered by _html_to_markdown
+_MARKDOWN_HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# First URL in a note; length-capped so pasted blobs cannot produce huge matches
+_SOURCE_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]{1,2048}')
+
+# Obsidian wikilinks treated as tags
+_WIKILINK_TAG_RE = re.compile(r'\[\[([^\]]+)\]\]')
+
+# Markdown ATX heading prefixes, checked in a single startswith call
+_MARKDOWN_HEADING_PREFIXES = ('# ', '## ', '### ', '#### ', '##### ', '###### ')
+
+# Lines made only of separators and markup symbols
+_SYMBOL_LINE_RE = re.compile(r'^[\s\-\|:\+\*=#]+$')
+
+# LinkedIn-specific navigation text patterns removed from HTML clippings
+_LINKEDIN_NAV_PATTERNS = [
+    r'skip to main content',
+    r'find people, jobs, companies',
+    r'grow my network',
+    r'pending invitations',
+    r'people you may know',
+    r'add contacts',
+    r'account & settings',
+    r'sign out',
+    r'upgrade.*account',
+    r'job posting manage',
+    r'company page manage',
+    r'privacy.*settings',
+    r'help center',
+    r'get help',
+    r'edit profile',
+    r'who.*viewed.*profile',
+    r'your updates',
+    r'connections',
+    r'find alumni',
+    r'learning',
+    r'talent solutions',
+    r'sales solutions',
+    r'try premium',
+    r'user agreement',
+    r'privacy policy',
+    r'ad choices',
+    r'community guidelines',
+    r'cookie policy',
+    r'discover more stories',
+    r'don.*miss more posts',
+    r'sign in to like',
+    r'sign in to reply'
+]
+_LINKEDIN_NAV_RE = re.compile('|'.join(f'(?:{p})' for p in _LINKEDIN_NAV_PATTERNS), re.IGNORECASE)
+
+# Patterns for malformed/problematic content that causes infinite loops
+_MALFORMED_URL_PATTERNS = [
+    # Complex malformed Obsidian links with embedded markdown and URLs
+    r'!\[\[attachments/[^\]]*\]\]!\[\[attachments/[^\]]*\]\]\]\(http[^\)]*\)',
+    # URLs with trailing punctuation that breaks parsing
+    r'(https?://[^\s\)]+)\)\s*\)',
+    r'(https?://[^\s\)]+)\?\s*\)',
+    # Malformed email tracking URLs (too long and complex)
+    r'http://tk\.wsjemail\.com/track\?[^\s\)]{200,}',
+    # Broken Obsidian link syntax
+    r'!\[\[attachments/[^\]]*\]\]!\[\[attachments/[^\]]*\]\]',
+    # URLs that look like filesystem paths (probably broken)
+    r'https?://[^\s]*\$FILE/[^\s]*',
+    # Complex malformed patterns with mixed syntax
+    r'[![^]]*\]\([^)]*\$FILE[^)]*\)',
+    # Social media and sharing URLs
+    r'https?://twitter\.com/intent/tweet[^\s\)]*',
+    r'https?://[^\s]*facebook[^\s\)]*',
+    r'https?://[^\s]*linkedin[^\s\)]*',
+    # Broken Obsidian references with unknown filenames
+    r'!\[\[attachments/[^\]]*unknown_filename[^\]]*\]\]',
+    r'!\[\[[^\]]*resources/[^\]]*\]\]',
+    # Navigation links that are clearly not content
+    r'\[[^\]]*\]\(http://www\.thejakartapost\.com/news/\d{4}/\d{2}/\d{2}/[^\)]*\)',
+]
+_MALFORMED_URL_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in _MALFORMED_URL_PATTERNS]
+_MALFORMED_URL_HINT_RE = re.compile(r'http|!\[\[|\$FILE', re.IGNORECASE)
+
+# Whitespace left behind by removals: runs of blank lines, then repeated spaces
+_WHITESPACE_FIX_RE = re.compile(r'(\n\s*\n\s*\n)|(  +)')
+
+
+def _fix_whitespace_match(match: re.Match) -> str:
+    """Replacement for _WHITESPACE_FIX_RE matches."""
+    return '\n\n' if match.group(1) else ' '
+
+
+# Content type detection patterns. Each list is fused into one alternation so
+# a check is a single search over the note instead of one search per pattern.
+
+# PDF references
+_PDF_REFERENCE_PATTERNS = [
+    r'\.pdf',
+    r'PDF',
+    r'pdf',
+    r'\[\[.*\.pdf\]\]',  # Obsidian PDF links
+    r'!\[\[.*\.pdf\]\]'  # Obsidian PDF embeds
+]
+_PDF_REFERENCE_RE = re.compile('|'.join(f'(?:{p})' for p in _PDF_REFERENCE_PATTERNS), re.IGNORECASE)
+
+# Audio/media references
+_AUDIO_REFERENCE_PATTERNS = [
+    r'!\[\[.*\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)\]\]',  # Obsidian audio embeds
+    r'!\[.*\]\(.*\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)\)',  # Markdown audio links
+    r'<audio[^>]*>',  # HTML audio tags
+    r'<video[^>]*>',  # HTML video tags
+    r'\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)',  # Audio file extensions
+    r'!\[\[attachments/[^/]*\.resources/.*\]\]',  # Obsidian generic resource references (often audio)
+    r'\d{1,2}\s+(ago|ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)\.\s+\d{4}\s+\d{1,2}:\d{2}:\d{2}',  # Timestamp patterns
+]
+_AUDIO_REFERENCE_RE = re.compile('|'.join(f'(?:{p})' for p in _AUDIO_REFERENCE_PATTERNS), re.IGNORECASE)
+
+# Image references
+_IMAGE_REFERENCE_PATTERNS = [
+    r'\.(png|jpg|jpeg|gif|svg|webp)',
+    r'!\[\[.*\.(png|jpg|jpeg|gif|svg|webp)\]\]',  # Obsidian image embeds
+    r'<img[^>]*>',  # HTML image tags
+    r'image',
+    r'Image'
+]
+_IMAGE_REFERENCE_RE = re.compile('|'.join(f'(?:{p})' for p in _IMAGE_REFERENCE_PATTERNS), re.IGNORECASE)
+
+# URL references
+_URL_REFERENCE_PATTERNS = [
+    r'https?://',  # Fixed: was http[s]
+    r'<https?://',  # Markdown/HTML wrapped URLs
+    r'www\.',
+    r'linkedin\.com',
+    r'twitter\.com',
+    r'facebook\.com'
+]
+_URL_REFERENCE_RE = re.compile('|'.join(f'(?:{p})' for p in _URL_REFERENCE_PATTERNS), re.IGNORECASE)
+
+# Strong indicators of web clipping (HTML structure)
+_WEB_CLIPPING_HTML_PATTERNS = [
+    r'<html',
+    r'<div[^>]*>.*</div>',  # Actual div content, not just isolated tags
+    r'<span[^>]*>.*</span>',  # Actual span content
+    r'<p[^>]*>.*</p>',  # Actual paragraph content
+    r'<article[^>]*>',
+    r'<section[^>]*>',
+    r'<header[^>]*>',
+    r'<main[^>]*>',
+]
+_WEB_CLIPPING_HTML_RE = re.compile('|'.join(f'(?:{p})' for p in _WEB_CLIPPING_HTML_PATTERNS), re.IGNORECASE | re.DOTALL)
+
+# Additional indicators of web scraping
+_WEB_SCRAPING_PATTERNS = [
+    r'Published by',
+    r'By\s+[A-Z][a-z]+\s+[A-Z][a-z]+',  # "By Author Name"
+    r'Copyright\s+©',
+    r'© \d{4}',
+    r'AddThis Sharing',
+    r'Share on',
+    r'Follow us on',
+    r'Subscribe to',
+    r'Read more',
+    r'Continue reading',
+    r'View original',
+]
+_WEB_SCRAPING_RE = re.compile('|'.join(f'(?:{p})' for p in _WEB_SCRAPING_PATTERNS), re.IGNORECASE)
+
+# Academic vocabulary
+_ACADEMIC_PATTERNS = [
+    r'academic',
+    r'research',
+    r'study',
+    r'paper',
+    r'journal',
+    r'conference',
+    r'proceedings',
+    r'abstract',
+    r'methodology',
+    r'literature review'
+]
+_ACADEMIC_RE = re.compile('|'.join(f'(?:{p})' for p in _ACADEMIC_PATTERNS), re.IGNORECASE)
+
+# Anything ContentExtractor could pull linked content from (URLs, PDFs, images)
+_LINKED_CONTENT_HINT_RE = re.compile(r'https?://|\.(?:pdf|png|jpe?g|gif|bmp|tiff)', re.IGNORECASE)
+
+# Below this many notes, starting worker processes costs more than it saves
+# (unless the caller asks for a specific number of workers)
+_MIN_NOTES_FOR_WORKERS = 16
+
+# Worker processes are never forked: notes may be loaded while other threads
+# (e.g. AI analysis) hold locks a forked child would inherit in a locked state
+_WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
 
 class ContentProcessor:
     """Processes and cleans Obsidian note content."""
@@ -40,6 +363,16 @@ class ContentProcessor:
         self.preserve_metadata = preserve_metadata
         self.extract_linked_content = extract_linked_content
         
+        # Constructor arguments, so worker processes can build an equivalent processor
+        self._init_kwargs = {
+            'clean_html': clean_html,
+            'preserve_metadata': preserve_metadata,
+            'extract_linked_content': extract_linked_content,
+            'max_pdf_pages': max_pdf_pages,
+            'intelligent_extraction': intelligent_extraction,
+            'ai_model': ai_model,
+        }
+        
         # Initialize content extractor if enabled
         if self.extract_linked_content:
             self.content_extractor = ContentExtractor(
@@ -73,30 +406,49 @@ class ContentProcessor:
         else:
             self.clutter_patterns = []
     
-    def process_note(self, file_path: Path) -> Note:
+    def process_note(self, file_path: Path, stat_result: Optional[os.stat_result] = None,
+                     min_content_chars: Optional[int] = None) -> Optional[Note]:
         """Process a single note file and return a Note object.
         
         Args:
             file_path: Path to the note file
+            stat_result: Stat of the file if the caller already has it (e.g. from
+                ``os.scandir``); avoids another stat syscall for the dates
+            min_content_chars: If set, notes whose body (the text after the
+                frontmatter) is shorter than this are skipped before cleaning
+                (notes referencing audio are always kept)
             
         Returns:
-            Note object with processed content
+            Note object with processed content, or None if the note was skipped
+            for being too short
         """
-        logger.info(f"Processing note: {file_path}")
+        logger.debug(f"Processing note: {file_path}")
+        
+        # Read the bytes once; a latin-1 fallback then only re-decodes, not re-reads
+        try:
+            raw = file_path.read_bytes()
+        except Exception as e:
+            logger.error(f"Failed to read {file_path}: {e}")
+            raise
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = raw.decode('utf-8')
         except UnicodeDecodeError:
             logger.warning(f"Unicode decode error for {file_path}, trying different encoding")
-            try:
-                content = file_path.read_text(encoding='latin-1')
-            except Exception as e:
-                logger.error(f"Failed to read {file_path}: {e}")
-                raise
+            content = raw.decode('latin-1')
+        
+        # Match text-mode reading, which translates Windows/old Mac line endings
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         # Extract metadata and content
         metadata, clean_content = self._extract_metadata_and_content(content)
         
+        # Checked on the body, as content typing and the later length check are
+        if min_content_chars is not None and self._is_too_short_to_process(clean_content, min_content_chars):
+            logger.debug(f"Skipping minimal content before processing: {file_path} ({len(clean_content.strip())} chars)")
+            return None
+        
         # Determine content type
         content_type = self._determine_content_type(metadata, clean_content)
         
@@ -139,7 +491,7 @@ class ContentProcessor:
         title = self._extract_title(metadata, clean_content, file_path)
         
         # Extract dates
-        created_date, modified_date = self._extract_dates(metadata, file_path)
+        created_date, modified_date = self._extract_dates(metadata, file_path, stat_result)
         
         # Extract tags
         tags = self._extract_tags(metadata, clean_content)
@@ -163,6 +515,109 @@ class ContentProcessor:
             source_url=source_url
         )
     
+    def process_notes(self, file_paths: List[Path], max_workers: Optional[int] = None,
+                      stat_results: Optional[List[Optional[os.stat_result]]] = None) -> List[Note]:
+        """Process many note files in parallel worker processes.
+        
+        Parsing and cleaning are CPU-bound pure-Python work, so notes are
+        spread over a process pool. Each worker builds its own processor from
+        this processor's settings.
+        
+        Args:
+            file_paths: Paths of the note files to process
+            max_workers: Number of worker processes (defaults to the CPU count;
+                1 processes the notes in this process)
+            stat_results: Stats of the files, aligned with ``file_paths``, if
+                already known (e.g. from discovery)
+            
+        Returns:
+            Successfully processed notes, in the order of ``file_paths``.
+            Notes that fail to process are logged and skipped.
+        """
+        notes = self.iter_process_notes(file_paths, max_workers, stat_results=stat_results)
+        return [note for note in notes if note is not None]
+    
+    def iter_process_notes(self, file_paths: List[Path], max_workers: Optional[int] = None,
+                           min_content_chars: Optional[int] = None,
+                           stat_results: Optional[List[Optional[os.stat_result]]] = None) -> Iterator[Optional[Note]]:
+        """Process note files in parallel, yielding each note as soon as it is ready.
+        
+        Same as :meth:`process_notes`, but results are streamed so callers can
+        report progress or filter notes while the workers keep going.
+        
+        Args:
+            file_paths: Paths of the note files to process
+            max_workers: Number of worker processes (defaults to the CPU count,
+                or to this process for small batches; 1 processes the notes in
+                this process)
+            min_content_chars: Skip notes shorter than this before processing
+                (see :meth:`process_note`)
+            stat_results: Stats of the files, aligned with ``file_paths``, if
+                already known (e.g. from discovery)
+            
+        Yields:
+            One processed note per path, in the order of ``file_paths``, or
+            None where processing failed or the note was skipped
+        """
+        if stat_results is None:
+            stat_results = list(repeat(None, len(file_paths)))
+        process_safe = partial(self._process_note_safe, min_content_chars=min_content_chars)
+        small_batch = max_workers is None and len(file_paths) < _MIN_NOTES_FOR_WORKERS
+        if max_workers == 1 or len(file_paths) <= 1 or small_batch:
+            yield from map(process_safe, file_paths, stat_results)
+            return
+        
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context(_WORKER_START_METHOD),
+                                     initializer=_init_worker_processor,
+                                     initargs=(self._init_kwargs,)) as executor:
+                process_in_worker = partial(_process_note_in_worker, min_content_chars=min_content_chars)
+                for note in executor.map(process_in_worker, file_paths, stat_results, chunksize=16):
+                    yield note
+                    done += 1
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Parallel note processing unavailable, processing sequentially: {e}")
+            yield from map(process_safe, file_paths[done:], stat_results[done:])
+    
+    def _is_too_short_to_process(self, content: str, min_chars: int) -> bool:
+        """Check whether a note body is too short to be worth cleaning.
+        
+        Cleaning only ever shortens the text, so a body already below
+        ``min_chars`` cannot reach it afterwards. Notes referencing audio are
+        kept regardless, and so are notes with links whose extracted content
+        could make them longer.
+        
+        Args:
+            content: Note body, without frontmatter
+            min_chars: Minimum number of characters
+            
+        Returns:
+            True if the note can be skipped
+        """
+        if len(content.strip()) >= min_chars or self._contains_audio_references(content):
+            return False
+        return not (self.extract_linked_content and _LINKED_CONTENT_HINT_RE.search(content))
+    
+    def _process_note_safe(self, file_path: Path, stat_result: Optional[os.stat_result] = None,
+                           min_content_chars: Optional[int] = None) -> Optional[Note]:
+        """Process a note, logging and swallowing any failure.
+        
+        Args:
+            file_path: Path to the note file
+            stat_result: Stat of the file, if already known
+            min_content_chars: Skip the note if shorter (see :meth:`process_note`)
+            
+        Returns:
+            Processed note, or None if processing failed or the note was skipped
+        """
+        try:
+            return self.process_note(file_path, stat_result, min_content_chars)
+        except Exception as e:
+            logger.error(f"Failed to process note {file_path}: {e}")
+            return None
+    
     def _extract_metadata_and_content(self, content: str) -> Tuple[Dict[str, Any], str]:
         """Extract YAML frontmatter metadata and content.
         
@@ -178,32 +633,54 @@ class ContentProcessor:
         # Check for YAML frontmatter
         if content.startswith('---'):
             try:
-                # Find end of frontmatter
-                end_index = content.find('---', 3)
+                # Find the closing delimiter on its own line so '---' inside values is ignored
+                end_index = content.find('\n---', 3)
                 if end_index != -1:
                     frontmatter = content[3:end_index].strip()
-                    clean_content = content[end_index + 3:].strip()
+                    clean_content = content[end_index + 4:].strip()
+                    
+                    try:
+                        parsed = yaml.load(frontmatter, Loader=_YAML_LOADER) if frontmatter else {}
+                    except yaml.YAMLError:
+                        parsed = None
                     
-                    # Parse YAML-like frontmatter (simplified)
-                    for line in frontmatter.split('\n'):
-                        line = line.strip()
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # Remove quotes if present
-                            if value.startswith('"') and value.endswith('"'):
-                                value = value[1:-1]
-                            elif value.startswith("'") and value.endswith("'"):
-                                value = value[1:-1]
-                            
-                            metadata[key] = value
+                    if isinstance(parsed, dict):
+                        metadata = {str(key): value for key, value in parsed.items()}
+                    else:
+                        # Not valid YAML (common in clipped notes) - use the line-based parser
+                        metadata = self._parse_simple_frontmatter(frontmatter)
             except Exception as e:
                 logger.warning(f"Failed to parse frontmatter: {e}")
         
         return metadata, clean_content
     
+    @staticmethod
+    def _parse_simple_frontmatter(frontmatter: str) -> Dict[str, Any]:
+        """Parse YAML-like ``key: value`` frontmatter line by line.
+        
+        Args:
+            frontmatter: Frontmatter text without delimiters
+            
+        Returns:
+            Metadata dictionary
+        """
+        metadata = {}
+        for line in frontmatter.split('\n'):
+            line = line.strip()
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip()
+                
+                # Remove quotes if present
+                if value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
+                elif value.startswith("'") and value.endswith("'"):
+                    value = value[1:-1]
+                
+                metadata[key] = value
+        return metadata
+    
     def _determine_content_type(self, metadata: Dict[str, Any], content: str) -> ContentType:
         """Determine the type of content based on metadata and content.
         
@@ -250,26 +727,10 @@ class ContentProcessor:
     
     def _contains_pdf_references(self, content: str) -> bool:
         """Check if content contains PDF references."""
-        pdf_patterns = [
-            r'\.pdf',
-            r'PDF',
-            r'pdf',
-            r'\[\[.*\.pdf\]\]',  # Obsidian PDF links
-            r'!\[\[.*\.pdf\]\]'  # Obsidian PDF embeds
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in pdf_patterns)
+        return _PDF_REFERENCE_RE.search(content) is not None
     
     def _contains_audio_references(self, content: str) -> bool:
         """Check if content contains audio/media references."""
-        audio_patterns = [
-            r'!\[\[.*\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)\]\]',  # Obsidian audio embeds
-            r'!\[.*\]\(.*\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)\)',  # Markdown audio links
-            r'<audio[^>]*>',  # HTML audio tags
-            r'<video[^>]*>',  # HTML video tags
-            r'\.(mp3|mp4|wav|m4a|aac|flac|wma|ogg)',  # Audio file extensions
-            r'!\[\[attachments/[^/]*\.resources/.*\]\]',  # Obsidian generic resource references (often audio)
-            r'\d{1,2}\s+(ago|ene|feb|mar|abr|may|jun|jul|ago|sep|oct|nov|dic)\.\s+\d{4}\s+\d{1,2}:\d{2}:\d{2}',  # Timestamp patterns
-        ]
         
         # Also check if content is minimal and mainly contains attachment references
         lines = content.strip().split('\n')
@@ -280,30 +741,15 @@ class ContentProcessor:
         if len(non_empty_lines) <= 3 and attachment_lines > 0:
             return True
         
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in audio_patterns)
+        return _AUDIO_REFERENCE_RE.search(content) is not None
     
     def _contains_image_references(self, content: str) -> bool:
         """Check if content contains image references."""
-        image_patterns = [
-            r'\.(png|jpg|jpeg|gif|svg|webp)',
-            r'!\[\[.*\.(png|jpg|jpeg|gif|svg|webp)\]\]',  # Obsidian image embeds
-            r'<img[^>]*>',  # HTML image tags
-            r'image',
-            r'Image'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in image_patterns)
+        return _IMAGE_REFERENCE_RE.search(content) is not None
     
     def _contains_urls(self, content: str) -> bool:
         """Check if content contains URLs."""
-        url_patterns = [
-            r'https?://',  # Fixed: was http[s]
-            r'<https?://',  # Markdown/HTML wrapped URLs
-            r'www\.',
-            r'linkedin\.com',
-            r'twitter\.com',
-            r'facebook\.com'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in url_patterns)
+        return _URL_REFERENCE_RE.search(content) is not None
     
     def _is_primarily_url_reference(self, content: str) -> bool:
         """Check if content is primarily a URL reference/bookmark vs personal content with URLs.
@@ -354,18 +800,6 @@ class ContentProcessor:
         A web clipping should have substantial HTML content or clear signs of web scraping.
         This is different from a simple URL reference or bookmark.
         """
-        # Strong indicators of web clipping (HTML structure)
-        html_indicators = [
-            r'<html',
-            r'<div[^>]*>.*</div>',  # Actual div content, not just isolated tags
-            r'<span[^>]*>.*</span>',  # Actual span content
-            r'<p[^>]*>.*</p>',  # Actual paragraph content
-            r'<article[^>]*>',
-            r'<section[^>]*>',
-            r'<header[^>]*>',
-            r'<main[^>]*>',
-        ]
-        
         # Count HTML tags - if there are many, it's likely a web clipping
         html_tag_count = len(re.findall(r'<[^>]+>', content))
         
@@ -378,28 +812,12 @@ class ContentProcessor:
         # 2. Has substantial text content (not just a URL + short description)
         # 3. Contains specific HTML elements that indicate scraped content
         
-        has_html_structure = any(re.search(pattern, content, re.IGNORECASE | re.DOTALL) 
-                               for pattern in html_indicators)
+        has_html_structure = _WEB_CLIPPING_HTML_RE.search(content) is not None
         has_many_html_tags = html_tag_count > 5
         has_substantial_content = word_count > 50
         
         # Additional indicators of web scraping
-        web_scraping_indicators = [
-            r'Published by',
-            r'By\s+[A-Z][a-z]+\s+[A-Z][a-z]+',  # "By Author Name"
-            r'Copyright\s+©',
-            r'© \d{4}',
-            r'AddThis Sharing',
-            r'Share on',
-            r'Follow us on',
-            r'Subscribe to',
-            r'Read more',
-            r'Continue reading',
-            r'View original',
-        ]
-        
-        has_web_metadata = any(re.search(pattern, content, re.IGNORECASE) 
-                              for pattern in web_scraping_indicators)
+        has_web_metadata = _WEB_SCRAPING_RE.search(content) is not None
         
         # It's a web clipping if:
         # - Has HTML structure AND substantial content, OR
@@ -415,19 +833,7 @@ class ContentProcessor:
     
     def _is_academic_content(self, content: str) -> bool:
         """Check if content is academic in nature."""
-        academic_patterns = [
-            r'academic',
-            r'research',
-            r'study',
-            r'paper',
-            r'journal',
-            r'conference',
-            r'proceedings',
-            r'abstract',
-            r'methodology',
-            r'literature review'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in academic_patterns)
+        return _ACADEMIC_RE.search(content) is not None
     
     def _clean_html_content(self, content: str) -> str:
         """Clean HTML content and convert to clean markdown.
@@ -450,13 +856,17 @@ class ContentProcessor:
         is_html = any(indicator in content for indicator in html_indicators)
         
         if is_html:
-            # Parse HTML with BeautifulSoup
+            # Parse HTML with BeautifulSoup, preferring the C-based lxml tree builder
             try:
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, 'lxml')
             except Exception as e:
-                logger.warning(f"Failed to parse HTML with BeautifulSoup: {e}")
-                # Fallback: basic HTML tag removal
-                return self._basic_html_cleanup(content)
+                logger.debug(f"lxml parser unavailable, using html.parser: {e}")
+                try:
+                    soup = BeautifulSoup(content, 'html.parser')
+                except Exception as e:
+                    logger.warning(f"Failed to parse HTML with BeautifulSoup: {e}")
+                    # Fallback: basic HTML tag removal
+                    return self._basic_html_cleanup(content)
             
             # Remove unwanted elements
             for element in soup.find_all(self.html_elements_to_remove):
@@ -703,48 +1113,11 @@ class ContentProcessor:
                 if any(clutter in id_str for clutter in clutter_classes):
                     element.decompose()
         
-        # Remove LinkedIn-specific navigation text patterns
-        linkedin_patterns = [
-            r'skip to main content',
-            r'find people, jobs, companies',
-            r'grow my network',
-            r'pending invitations',
-            r'people you may know',
-            r'add contacts',
-            r'account & settings',
-            r'sign out',
-            r'upgrade.*account',
-            r'job posting manage',
-            r'company page manage',
-            r'privacy.*settings',
-            r'help center',
-            r'get help',
-            r'edit profile',
-            r'who.*viewed.*profile',
-            r'your updates',
-            r'connections',
-            r'find alumni',
-            r'learning',
-            r'talent solutions',
-            r'sales solutions',
-            r'try premium',
-            r'user agreement',
-            r'privacy policy',
-            r'ad choices',
-            r'community guidelines',
-            r'cookie policy',
-            r'discover more stories',
-            r'don.*miss more posts',
-            r'sign in to like',
-            r'sign in to reply'
-        ]
-        
-        # Remove elements containing LinkedIn navigation patterns
-        import re
-        for pattern in linkedin_patterns:
-            for element in soup.find_all(string=re.compile(pattern, re.IGNORECASE)):
-                if element.parent:
-                    element.parent.decompose()
+        # Remove elements containing LinkedIn navigation patterns in a single tree pass
+        for element in soup.find_all(string=_LINKEDIN_NAV_RE):
+            parent = getattr(element, 'parent', None)  # Strings under an already removed parent lose it
+            if parent is not None and not parent.decomposed:
+                parent.decompose()
         
         # Remove tables that look like navigation/layout (not content)
         for table in soup.find_all('table'):
@@ -812,47 +1185,56 @@ class ContentProcessor:
             # Fallback: use body content but clean it aggressively
             content_to_convert = soup.find('body') or soup
         
-        # Convert to markdown with proper structure
+        # Convert to markdown with proper structure, walking the tree once in
+        # document order. Block elements are rendered whole and not descended
+        # into, so nested paragraphs and list items are not emitted twice.
         markdown_content = []
+        stack = list(reversed(content_to_convert.contents))
         
-        # Process headings
-        for heading in content_to_convert.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            level = int(heading.name[1])
-            text = heading.get_text().strip()
-            if text and len(text) > 3:  # Only add meaningful headings
-                markdown_content.append(f"{'#' * level} {text}")
-                markdown_content.append("")
-        
-        # Process paragraphs
-        for p in content_to_convert.find_all('p'):
-            text = p.get_text().strip()
-            if text and len(text) > 20:  # Only add substantial paragraphs
-                # Clean up the text
-                text = self._clean_text_content(text)
-                if text:
-                    markdown_content.append(text)
+        while stack:
+            element = stack.pop()
+            name = getattr(element, 'name', None)
+            if name is None:
+                continue  # Text, comments and other non-tag nodes
+            
+            if name in _MARKDOWN_HEADING_TAGS:
+                level = int(name[1])
+                text = element.get_text().strip()
+                if text and len(text) > 3:  # Only add meaningful headings
+                    markdown_content.append(f"{'#' * level} {text}")
                     markdown_content.append("")
-        
-        # Process lists
-        for ul in content_to_convert.find_all(['ul', 'ol']):
-            list_items = ul.find_all('li')
-            if len(list_items) > 0:
-                for li in list_items:
-                    text = li.get_text().strip()
-                    if text and len(text) > 5:
-                        text = self._clean_text_content(text)
-                        if text:
-                            markdown_content.append(f"- {text}")
-                markdown_content.append("")
-        
-        # Process blockquotes
-        for blockquote in content_to_convert.find_all('blockquote'):
-            text = blockquote.get_text().strip()
-            if text and len(text) > 20:
-                text = self._clean_text_content(text)
-                if text:
-                    markdown_content.append(f"> {text}")
+            
+            elif name == 'p':
+                text = element.get_text().strip()
+                if text and len(text) > 20:  # Only add substantial paragraphs
+                    # Clean up the text
+                    text = self._clean_text_content(text)
+                    if text:
+                        markdown_content.append(text)
+                        markdown_content.append("")
+            
+            elif name in ('ul', 'ol'):
+                # Direct items only; nested lists are part of their item's text
+                list_items = element.find_all('li', recursive=False)
+                if len(list_items) > 0:
+                    for li in list_items:
+                        text = li.get_text().strip()
+                        if text and len(text) > 5:
+                            text = self._clean_text_content(text)
+                            if text:
+                                markdown_content.append(f"- {text}")
                     markdown_content.append("")
+            
+            elif name == 'blockquote':
+                text = element.get_text().strip()
+                if text and len(text) > 20:
+                    text = self._clean_text_content(text)
+                    if text:
+                        markdown_content.append(f"> {text}")
+                        markdown_content.append("")
+            
+            else:
+                stack.extend(reversed(element.contents))
         
         # Join and clean up
         result = "\n".join(markdown_content)
@@ -964,17 +1346,13 @@ class ContentProcessor:
             Cleaned content
         """
         # Remove HTML tags
-        content = re.sub(r'<[^>]+>', '', content)
+        content = _HTML_TAG_RE.sub('', content)
         
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RUN_RE.sub(' ', content)
         
-        # Remove HTML entities
-        content = content.replace('&nbsp;', ' ')
-        content = content.replace('&amp;', '&')
-        content = content.replace('&lt;', '<')
-        content = content.replace('&gt;', '>')
-        content = content.replace('&quot;', '"')
+        # Decode all named and numeric HTML entities in one pass
+        content = unescape(content).replace('\u00a0', ' ')
         
         return content.strip()
     
@@ -990,29 +1368,29 @@ class ContentProcessor:
             Extracted title
         """
         # Try metadata first
-        if 'title' in metadata:
-            return metadata['title']
+        if metadata.get('title'):
+            return str(metadata['title'])
         
         # Try to extract from content (first heading or first line)
         lines = content.split('\n')
         for line in lines:
             line = line.strip()
-            if line.startswith('# '):
-                return line[2:].strip()
-            elif line.startswith('## '):
-                return line[3:].strip()
+            if line.startswith(_MARKDOWN_HEADING_PREFIXES):
+                return line[line.index(' ') + 1:].strip()
             elif line and not line.startswith('---'):
                 return line[:100]  # Limit length
         
         # Fallback to filename
         return file_path.stem.replace('_', ' ').replace('-', ' ')
     
-    def _extract_dates(self, metadata: Dict[str, Any], file_path: Path) -> Tuple[Optional[datetime], Optional[datetime]]:
+    def _extract_dates(self, metadata: Dict[str, Any], file_path: Path,
+                       stat_result: Optional[os.stat_result] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
         """Extract creation and modification dates.
         
         Args:
             metadata: Note metadata
             file_path: Path to the note file
+            stat_result: Pre-fetched stat of the file; stat'ed here only if needed
             
         Returns:
             Tuple of (created_date, modified_date)
@@ -1022,32 +1400,48 @@ class ContentProcessor:
         
         # Try metadata dates
         if 'created' in metadata:
-            try:
-                created_date = datetime.fromisoformat(metadata['created'].replace('Z', '+00:00'))
-            except ValueError:
-                pass
+            created_date = self._parse_metadata_date(metadata['created'])
         
         if 'modified' in metadata:
-            try:
-                modified_date = datetime.fromisoformat(metadata['modified'].replace('Z', '+00:00'))
-            except ValueError:
-                pass
+            modified_date = self._parse_metadata_date(metadata['modified'])
         
-        # Fallback to file system dates
-        if not created_date:
-            try:
-                created_date = datetime.fromtimestamp(file_path.stat().st_ctime)
-            except OSError:
-                pass
-        
-        if not modified_date:
-            try:
-                modified_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-            except OSError:
-                pass
+        # Fallback to file system dates (a single stat covers both)
+        if not created_date or not modified_date:
+            if stat_result is None:
+                try:
+                    stat_result = file_path.stat()
+                except OSError:
+                    stat_result = None
+            
+            if stat_result is not None:
+                if not created_date:
+                    created_date = datetime.fromtimestamp(stat_result.st_ctime)
+                if not modified_date:
+                    modified_date = datetime.fromtimestamp(stat_result.st_mtime)
         
         return created_date, modified_date
     
+    @staticmethod
+    def _parse_metadata_date(value: Any) -> Optional[datetime]:
+        """Convert a frontmatter date value to a datetime.
+        
+        Args:
+            value: Date as parsed from frontmatter (string, date or datetime)
+            
+        Returns:
+            Parsed datetime, or None if the value is not a valid date
+        """
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime.combine(value, datetime.min.time())
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)  # Accepts a trailing 'Z' since Python 3.11
+            except ValueError:
+                return None
+        return None
+    
     def _extract_tags(self, metadata: Dict[str, Any], content: str) -> List[str]:
         """Extract tags from metadata or content.
         
@@ -1063,20 +1457,16 @@ class ContentProcessor:
         # Try metadata tags
         if 'tags' in metadata:
             if isinstance(metadata['tags'], list):
-                tags.extend(metadata['tags'])
+                tags.extend(str(tag) for tag in metadata['tags'] if tag is not None)
             elif isinstance(metadata['tags'], str):
                 # Parse comma-separated tags
                 tags.extend([tag.strip() for tag in metadata['tags'].split(',')])
         
         # Try to extract tags from content (Obsidian format: [[tag]])
-        tag_pattern = r'\[\[([^\]]+)\]\]'
-        content_tags = re.findall(tag_pattern, content)
-        tags.extend(content_tags)
-        
-        # Remove duplicates and clean
-        tags = list(set([tag.strip() for tag in tags if tag.strip()]))
+        tags.extend(_WIKILINK_TAG_RE.findall(content))
         
-        return tags
+        # Remove duplicates and clean, keeping first-seen order
+        return list(dict.fromkeys(filter(None, (tag.strip() for tag in tags))))
     
     def _extract_source_url(self, metadata: Dict[str, Any], content: str) -> Optional[str]:
         """Extract source URL from metadata or content.
@@ -1090,16 +1480,14 @@ class ContentProcessor:
         """
         # Try metadata first
         if 'source' in metadata:
-            source = metadata['source']
+            source = str(metadata['source'])
             if source.startswith('http'):
                 return source
         
         # Try to find URLs in content
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        urls = re.findall(url_pattern, content)
-        
-        if urls:
-            return urls[0]  # Return first URL found
+        match = _SOURCE_URL_RE.search(content)
+        if match:
+            return match.group(0)  # Return first URL found
         
         return None
     
@@ -1189,90 +1577,56 @@ class ContentProcessor:
         cleaned_lines = []
         in_article_content = False
         
+        # One scan over the whole document decides whether per-line indicator
+        # searches can find anything at all; clean documents skip them entirely
+        may_have_skip_indicators = _ARTICLE_SKIP_INDICATOR_RE.search(content) is not None
+        may_have_clutter = _CLUTTER_INDICATOR_RE.search(content) is not None
+        
         for line in lines:
-            original_line = line
             line = line.strip()
             
             # Skip empty lines
             if not line:
                 continue
             
-            # Detect when we're in substantial article content
-            if (len(line) > 100 and any(word in line.lower() for word in 
-                ['government', 'project', 'projects', 'construction', 'infrastructure', 'million', 'billion', 'company', 'investment'])):
-                in_article_content = True
-            
-            # Keep substantial content lines (likely article paragraphs)
-            if (len(line) > 50 and 
-                any(word in line.lower() for word in ['the', 'and', 'said', 'project', 'company', 'government', 'will', 'would', 'can', 'construction', 'infrastructure', 'development'])):
-                cleaned_lines.append(line)
-                continue
+            if len(line) > 50:
+                line_lower = line.lower()
+                
+                # Detect when we're in substantial article content
+                if len(line) > 100 and _ARTICLE_WORD_RE.search(line_lower):
+                    in_article_content = True
+                
+                # Keep substantial content lines (likely article paragraphs)
+                if _CONTENT_WORD_RE.search(line_lower):
+                    cleaned_lines.append(line)
+                    continue
             
             # If we're in article content, be much more conservative about removal
             if in_article_content:
                 # Only remove very obvious clutter in article content
-                skip_indicators = [
-                    'PUBLICIDAD', 'Publicidad', 'Productos Yahoo!',
-                    'Más Buscados', 'Todo Sobre Los Mercados',
-                    'YAHOO! FINANZAS', 'Más Yahoo! Finanzas',
-                    'Correo electrónico', 'Share on', 'Back to'
-                ]
-                
-                # Only skip if it's clearly not article content
-                if any(indicator in line for indicator in skip_indicators):
+                if may_have_skip_indicators and _ARTICLE_SKIP_INDICATOR_RE.search(line):
                     continue
                 
                 # Keep any remaining content when in article mode
                 cleaned_lines.append(line)
                 continue
             
-            # Enhanced clutter removal for web content
-            clutter_indicators = [
-                'Buscar', 'buscar', 'Search', 'search',
-                'Yahoo!', 'Copyright', 'Todos los derechos',
-                'Política de privacidad', 'Términos del Servicio',
-                'Ayuda', 'Mail', 'Inicio', 'Ver más', 'Mostrar más',
-                'Saltar a', 'Haz de Y!', 'tu página de inicio',
-                'Correo electrónico', 'Facebook', 'Twitter',
-                'Publicar como', 'Escribe un comentario',
-                'Deja un comentario', 'Aún no Hay Comentarios',
-                'PUBLICIDAD', 'Publicidad', 'Productos Yahoo!',
-                'Más Buscados', 'Todo Sobre Los Mercados',
-                'Cotizaciones recientes', 'Hoy En Yahoo!',
-                'YAHOO! FINANZAS', 'Más Yahoo! Finanzas',
-                # Additional web clutter patterns
-                'Tweet', 'Share', 'LinkedIn', 'Reddit', 'Pinterest',
-                'Read also:', 'Related articles:', 'You might also like:',
-                'Trending now:', 'Most popular:', 'Recommended for you:',
-                'Subscribe to', 'Newsletter', 'Follow us', 'Sign up',
-                'This page has been shared', 'View these Tweets',
-                'Paper Edition', 'Page:', 'Print', 'Email this',
-                'Next threat:', 'Shuttlers win', 'Undervalued',
-                'Glorious moment', 'A weekend at', 'Headlines News'
-            ]
-            
             # Skip lines that contain clutter indicators (but preserve timestamps in article context)
-            skip_line = False
-            for indicator in clutter_indicators:
-                if indicator in line:
-                    # Exception: keep Reuters timestamps and source attributions
-                    if not (in_article_content and ('Reuters' in line or 'AFP' in line or 'EFE' in line) and ('Hace' in line or 'horas' in line or 'CDT' in line)):
-                        skip_line = True
-                        break
-            
-            if skip_line:
-                continue
+            if may_have_clutter and _CLUTTER_INDICATOR_RE.search(line):
+                # Exception: keep Reuters timestamps and source attributions
+                if not (in_article_content and ('Reuters' in line or 'AFP' in line or 'EFE' in line) and ('Hace' in line or 'horas' in line or 'CDT' in line)):
+                    continue
             
             # Skip lines that are mostly symbols/punctuation
             if len(line) < 20 and not any(char.isalnum() for char in line):
                 continue
             
             # Skip lines that look like navigation (mostly links) unless they're article content
-            if not in_article_content and (line.count('|') > 3 or line.count('»') > 0):
+            if not in_article_content and ('»' in line or line.count('|') > 3):
                 continue
             
-            # Skip single-word lines that are likely navigation
-            if not in_article_content and len(line.split()) == 1 and len(line) < 15:
+            # Skip single-word lines that are likely navigation (length test first, it's free)
+            if not in_article_content and len(line) < 15 and len(line.split()) == 1:
                 continue
             
             # Skip table formatting lines
@@ -1280,14 +1634,15 @@ class ContentProcessor:
                 continue
             
             # Skip lines with just symbols
-            if re.match(r'^[\s\-\|:\+\*=#]+$', line):
+            if _SYMBOL_LINE_RE.match(line):
                 continue
             
             cleaned_lines.append(line)
         
         return '\n'.join(cleaned_lines)
     
-    def _has_meaningful_content(self, content: str, content_type: ContentType) -> bool:
+    @staticmethod
+    def _has_meaningful_content(content: str, content_type: ContentType) -> bool:
         """Check if content has meaningful information."""
         if not content or len(content.strip()) < 10:
             return False
@@ -1309,81 +1664,26 @@ class ContentProcessor:
         if len(unique_words) < len(meaningful_words) * 0.3:  # Too much repetition
             return False
         
-        # Check for common empty content patterns
-        empty_patterns = [
-            r'^#+\s*$',  # Only headers
-            r'^\s*$',    # Only whitespace
-            r'^!?\[\[.*\]\]\s*$',  # Only links
-            r'^https?://.*$',  # Only URLs
-            r'^.*TODO.*$',  # TODO placeholders
-            r'^.*placeholder.*$',  # Placeholder text
-        ]
-        
-        # Check for web clutter patterns (Spanish and English)
-        web_clutter_patterns = [
-            r'^Secciones$',  # Section headers
-            r'^Casa Real.*',  # Royal family section
-            r'^Madrid.*',  # Madrid section
-            r'^Sevilla.*',  # Sevilla section
-            r'^Aragón.*',  # Aragon section
-            r'^Canarias.*',  # Canary Islands section
-            r'^Castilla y León.*',  # Castile and Leon section
-            r'^Cataluña.*',  # Catalonia section
-            r'^C\. Valenciana.*',  # Valencia section
-            r'^Galicia.*',  # Galicia section
-            r'^Navarra.*',  # Navarre section
-            r'^País Vasco.*',  # Basque Country section
-            r'^Toledo.*',  # Toledo section
-            r'^Internacional.*',  # International section
-            r'^Declaración Renta.*',  # Tax declaration section
-            r'^Inmobiliario.*',  # Real estate section
-            r'^Blogs.*',  # Blogs section
-            r'^Fe De Ratas.*',  # Fe de Ratas section
-            r'^El Astrolabio.*',  # El Astrolabio section
-            r'^El Sacapuntas.*',  # El Sacapuntas section
-            r'^Real Madrid.*',  # Real Madrid section
-            r'^Atlético de Madrid.*',  # Atletico Madrid section
-            r'^Fútbol.*',  # Football section
-            r'^Baloncesto.*',  # Basketball section
-            r'^Tenis.*',  # Tennis section
-            r'^Fórmula 1.*',  # Formula 1 section
-            r'^Motos.*',  # Motorcycles section
-            r'^Náutica.*',  # Sailing section
-            r'^Ciclismo.*',  # Cycling section
-            r'^Torneo ACBNext.*',  # ACB Next tournament section
-            r'^Ciencia.*',  # Science section
-            r'^Salud.*',  # Health section
-            r'^Es Noticia$',  # It's News
-            r'^Castor.*',  # Castor news
-            r'^Presupuestos Generales.*',  # General Budget news
-            r'^Elecciones Francia.*',  # French elections news
-            r'^Cita Previa.*',  # Tax appointment news
-            r'^Regalos Día de la Madre.*',  # Mother's Day gifts news
-            r'^Venezuela.*',  # Venezuela news
-            r'^La Casa de Papel.*',  # Money Heist news
-            r'^YouTube.*',  # YouTube news
-            r'^Brexit.*',  # Brexit news
-            r'^Identifíquese$',  # Identify yourself
-            r'^Acceda a ClubABC.*',  # Access ClubABC
-            r'^Entre$',  # Enter
-            r'^¿Ha olvidado su contraseña\?$',  # Forgot password
-            r'^Regístrese$',  # Register
-            r'^Únase a ClubABC.*',  # Join ClubABC
-            r'^Regístrese ahora$',  # Register now
-            r'^Síguenos en$',  # Follow us
-            r'^_ABC\.es_$',  # ABC.es header
-        ]
-        
-        content_lines = [line.strip() for line in content.split('\n') if line.strip()]
+        content_lines = [line for line in (raw.strip() for raw in content.split('\n')) if line]
         meaningful_lines = 0
         web_clutter_lines = 0
+        remaining = len(content_lines)
         
         for line in content_lines:
+            remaining -= 1
             # Check if line contains web clutter
-            if any(re.match(pattern, line, re.IGNORECASE) for pattern in web_clutter_patterns):
+            if _WEB_CLUTTER_LINE_RE.match(line):
                 web_clutter_lines += 1
-            elif not any(re.match(pattern, line, re.IGNORECASE) for pattern in empty_patterns):
+                # Even if every remaining line were meaningful the note could not pass
+                if (meaningful_lines + remaining < 3 or
+                        web_clutter_lines > 0.6 * (meaningful_lines + web_clutter_lines + remaining)):
+                    return False
+            elif not _EMPTY_LINE_RE.match(line):
                 meaningful_lines += 1
+                # Even if every remaining line were clutter the note would still pass
+                if (meaningful_lines >= 3 and
+                        web_clutter_lines + remaining <= 0.6 * (meaningful_lines + web_clutter_lines + remaining)):
+                    return True
         
         # Calculate clutter ratio
         total_lines = meaningful_lines + web_clutter_lines
@@ -1399,7 +1699,8 @@ class ContentProcessor:
         # Must have at least 3 substantial content lines (more strict)
         return meaningful_lines >= 3
     
-    def _clean_malformed_urls(self, content: str) -> str:
+    @staticmethod
+    def _clean_malformed_urls(content: str) -> str:
         """Clean malformed URLs and broken links that cause processing issues.
         
         Args:
@@ -1411,40 +1712,31 @@ class ContentProcessor:
         if not content:
             return content
         
-        # Patterns for malformed/problematic content that causes infinite loops
-        malformed_patterns = [
-            # Complex malformed Obsidian links with embedded markdown and URLs
-            r'!\[\[attachments/[^\]]*\]\]!\[\[attachments/[^\]]*\]\]\]\(http[^\)]*\)',
-            # URLs with trailing punctuation that breaks parsing
-            r'(https?://[^\s\)]+)\)\s*\)',
-            r'(https?://[^\s\)]+)\?\s*\)',
-            # Malformed email tracking URLs (too long and complex)
-            r'http://tk\.wsjemail\.com/track\?[^\s\)]{200,}',
-            # Broken Obsidian link syntax
-            r'!\[\[attachments/[^\]]*\]\]!\[\[attachments/[^\]]*\]\]',
-            # URLs that look like filesystem paths (probably broken)
-            r'https?://[^\s]*\$FILE/[^\s]*',
-            # Complex malformed patterns with mixed syntax
-            r'[![^]]*\]\([^)]*\$FILE[^)]*\)',
-            # Social media and sharing URLs
-            r'https?://twitter\.com/intent/tweet[^\s\)]*',
-            r'https?://[^\s]*facebook[^\s\)]*',
-            r'https?://[^\s]*linkedin[^\s\)]*',
-            # Broken Obsidian references with unknown filenames
-            r'!\[\[attachments/[^\]]*unknown_filename[^\]]*\]\]',
-            r'!\[\[[^\]]*resources/[^\]]*\]\]',
-            # Navigation links that are clearly not content
-            r'\[[^\]]*\]\(http://www\.thejakartapost\.com/news/\d{4}/\d{2}/\d{2}/[^\)]*\)',
-        ]
-        
-        # Apply cleaning patterns
-        for pattern in malformed_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE)
+        # Every malformed pattern needs a URL, an Obsidian embed or a $FILE
+        # reference; notes without any of those skip the substitutions
+        if _MALFORMED_URL_HINT_RE.search(content):
+            for pattern in _MALFORMED_URL_RES:
+                content = pattern.sub('', content)
         
-        # Clean up extra whitespace left by removals
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-        content = re.sub(r'  +', ' ', content)
+        # Clean up extra whitespace left by removals (blank-line runs and
+        # repeated spaces) in a single scan
+        content = _WHITESPACE_FIX_RE.sub(_fix_whitespace_match, content)
         
         return content.strip()
     
 
+
+# Per-process processor used by ContentProcessor.process_notes workers
+_worker_processor: Optional[ContentProcessor] = None
+
+
+def _init_worker_processor(init_kwargs: Dict[str, Any]) -> None:
+    """Build the content processor for a worker process."""
+    global _worker_processor
+    _worker_processor = ContentProcessor(**init_kwargs)
+
+
+def _process_note_in_worker(file_path: Path, stat_result: Optional[os.stat_result] = None,
+                            min_content_chars: Optional[int] = None) -> Optional[Note]:
+    """Process a single note inside a worker process."""
+    return _worker_processor._process_note_safe(file_path, stat_result, min_content_chars)
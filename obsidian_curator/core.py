@@ -1,10 +1,20 @@
 """Core orchestration logic for the Obsidian curation system."""
 
+import hashlib
+import json
+import os
 import random
+import re
+import stat
+import tempfile
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Iterator
+from typing import TYPE_CHECKING, Dict, List, Optional, Iterator, Set
 
 from loguru import logger
 from tqdm import tqdm
@@ -12,16 +22,111 @@ from tqdm import tqdm
 from .models import (
     Note,
     CurationResult,
+    Theme,
     CurationConfig,
     CurationStats,
     VaultStructure,
     ProcessingCheckpoint,
 )
-from .content_processor import ContentProcessor
-from .ai_analyzer import AIAnalyzer
-from .theme_classifier import ThemeClassifier
-from .vault_organizer import VaultOrganizer
-from .note_discovery import discover_markdown_files
+from .note_discovery import discover_markdown_files_with_stats
+from .analysis_cache import (
+    AnalysisCache,
+    AnalysisResult,
+    SemanticAnalysisCache,
+    DEFAULT_CACHE_DIR,
+    model_fingerprint,
+    used_fallback,
+)
+from .title_index import NearDuplicateTitleIndex
+
+if TYPE_CHECKING:
+    from .content_processor import ContentProcessor
+    from .ai_analyzer import AIAnalyzer
+    from .theme_classifier import ThemeClassifier
+    from .vault_organizer import VaultOrganizer
+
+# Characters lowercased and hashed at a time when fingerprinting note content
+_FINGERPRINT_CHUNK = 1 << 16
+
+# Title normalization: ASCII characters that are neither word characters nor
+# whitespace are deleted with str.translate; the regex is only needed for
+# titles containing other characters
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ASCII_NON_WORD_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _NON_WORD_RE.match(c)))
+
+# Filename sanitation keeps word characters, spaces and hyphens; like title
+# normalization, ASCII titles only need the translate table
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+_ASCII_UNSAFE_FILENAME_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _UNSAFE_FILENAME_RE.match(c)))
+
+# Name prefix of the temporary vaults curated notes are saved to during analysis
+_TEMP_VAULT_PREFIX = "temp_curated_vault_"
+
+# Per-note curation decisions, written to the vault's metadata folder
+_DECISIONS_FILENAME = "curation_decisions.jsonl"
+
+# Notes with less content than this are skipped (audio annotations excepted)
+_MIN_NOTE_CHARS = 100
+
+
+def _content_fingerprint(content: str) -> bytes:
+    """Case-insensitive digest of note content for duplicate detection.
+    
+    Long notes are lowercased and hashed slice by slice, so no lowercased
+    copy of the whole note is built.
+    """
+    text = content.strip()
+    digest = hashlib.blake2b(digest_size=16)
+    for start in range(0, len(text), _FINGERPRINT_CHUNK):
+        digest.update(text[start:start + _FINGERPRINT_CHUNK].lower().encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _find_latest_temp_vault(parent: Path) -> Optional[Path]:
+    """Find the most recent temporary vault directory in *parent*.
+    
+    Temporary vaults are named ``temp_curated_vault_<timestamp>``; the one
+    with the highest timestamp is returned.
+    
+    Args:
+        parent: Directory to search
+        
+    Returns:
+        Path of the latest temporary vault, or None if there is none
+    """
+    latest, latest_stamp = None, -1
+    try:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if not entry.name.startswith(_TEMP_VAULT_PREFIX):
+                    continue
+                try:
+                    stamp = int(entry.name[len(_TEMP_VAULT_PREFIX):])
+                except ValueError:
+                    continue
+                if stamp > latest_stamp and entry.is_dir():
+                    latest, latest_stamp = entry.path, stamp
+    except OSError as e:
+        logger.warning(f"Could not scan {parent} for temporary directories: {e}")
+    return Path(latest) if latest is not None else None
+
+
+def _describe_directory(root: Path) -> str:
+    """List the files (with sizes) and directories below *root*.
+    
+    Used for debug logging; entries are lstat'ed so symlinks are not followed.
+    """
+    lines = []
+    for item in root.rglob("*"):
+        info = item.lstat()
+        if stat.S_ISDIR(info.st_mode):
+            lines.append(f"  Directory: {item.relative_to(root)}")
+        else:
+            lines.append(f"  File: {item.relative_to(root)} ({info.st_size} bytes)")
+    return "\n".join(lines)
 
 
 class ObsidianCurator:
@@ -34,23 +139,57 @@ class ObsidianCurator:
             config: Curation configuration
         """
         self.config = config
-        
-        # Initialize components
-        self.content_processor = ContentProcessor(
-            clean_html=config.clean_html,
-            preserve_metadata=config.preserve_metadata,
-            intelligent_extraction=True,  # Enable intelligent extraction by default
-            ai_model=config.ai_model  # Pass AI model for content curation
-        )
-        self.ai_analyzer = AIAnalyzer(config)
-        self.theme_classifier = ThemeClassifier(
-            similarity_threshold=config.theme_similarity_threshold
+        # Lowercased once; _should_curate matches every analyzed note against them
+        self._target_themes_lower = tuple(target.lower() for target in config.target_themes)
+        # Curation thresholds, read once instead of for every analyzed note
+        self._curation_thresholds = (
+            config.quality_threshold,
+            config.relevance_threshold,
+            config.analytical_depth_threshold,
+            config.min_content_length,
         )
-        self.vault_organizer = VaultOrganizer(config)
+        # File stats from the last discovery, reused when processing the notes
+        self._discovered_stats: Dict[Path, os.stat_result] = {}
+        # Theme folders already created by _save_note_immediately
+        self._created_theme_dirs: Set[Path] = set()
         
         logger.info("Obsidian Curator initialized")
         logger.debug(f"Configuration: {config}")
     
+    # Components are built on first use, so commands that only discover notes
+    # neither import the AI stack nor need a running Ollama server
+    
+    @cached_property
+    def content_processor(self) -> "ContentProcessor":
+        """Processor that reads and cleans notes."""
+        from .content_processor import ContentProcessor
+        return ContentProcessor(
+            clean_html=self.config.clean_html,
+            preserve_metadata=self.config.preserve_metadata,
+            intelligent_extraction=True,  # Enable intelligent extraction by default
+            ai_model=self.config.ai_model  # Pass AI model for content curation
+        )
+    
+    @cached_property
+    def ai_analyzer(self) -> "AIAnalyzer":
+        """Analyzer that scores notes with the configured models."""
+        from .ai_analyzer import AIAnalyzer
+        return AIAnalyzer(self.config)
+    
+    @cached_property
+    def theme_classifier(self) -> "ThemeClassifier":
+        """Classifier that groups curated notes by theme."""
+        from .theme_classifier import ThemeClassifier
+        return ThemeClassifier(
+            similarity_threshold=self.config.theme_similarity_threshold
+        )
+    
+    @cached_property
+    def vault_organizer(self) -> "VaultOrganizer":
+        """Organizer that writes the curated vault."""
+        from .vault_organizer import VaultOrganizer
+        return VaultOrganizer(self.config)
+    
     def curate_vault(self, input_path: Path, output_path: Path) -> CurationStats:
         """Curate an entire Obsidian vault.
         
@@ -107,16 +246,12 @@ class ObsidianCurator:
             
             logger.info(f"Content type distribution: {content_types}")
             
-            # Step 2: Process content
-            logger.info("Step 2: Processing content...")
-            processed_notes = self._process_notes(notes)
-            
-            # Step 3: AI analysis
-            logger.info("Step 3: Performing AI analysis...")
-            curation_results = self._analyze_notes(processed_notes)
+            # Step 2: AI analysis (content was processed when the notes were loaded)
+            logger.info("Step 2: Performing AI analysis...")
+            curation_results = self._analyze_notes(notes, output_path)
             
-            # Step 4: Create curated vault
-            logger.info("Step 4: Creating curated vault...")
+            # Step 3: Create curated vault
+            logger.info("Step 3: Creating curated vault...")
             stats = self._create_curated_vault(curation_results, output_path)
             
             # Update final statistics
@@ -141,13 +276,13 @@ class ObsidianCurator:
             List of Path objects for markdown files
         """
         try:
-            valid_files = discover_markdown_files(vault_path)
-            logger.info(f"Found {len(valid_files)} valid markdown files")
+            # Already sorted by modification time (newest first) for better
+            # sampling, using the stats taken during discovery
+            discovered = discover_markdown_files_with_stats(vault_path)
+            logger.info(f"Found {len(discovered)} valid markdown files")
             
-            # Sort by modification time (newest first) for better sampling
-            valid_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            return valid_files
+            self._discovered_stats = dict(discovered)
+            return [file_path for file_path, _ in discovered]
             
         except Exception as e:
             logger.error(f"Failed to discover notes in {vault_path}: {e}")
@@ -162,27 +297,28 @@ class ObsidianCurator:
         Returns:
             List of processed Note objects
         """
-        processor = ContentProcessor(
-            clean_html=self.config.clean_html,
-            preserve_metadata=self.config.preserve_metadata,
-            intelligent_extraction=True,
-            ai_model=self.config.ai_model
-        )
-        
         notes = []
         total_files = len(file_paths)
         processed_content_hashes = set()  # Track processed content to avoid duplicates
         processed_titles = set()  # Also track titles to catch near-duplicates
+        title_threshold = self.config.title_similarity_threshold
+        similar_titles = NearDuplicateTitleIndex(title_threshold) if title_threshold is not None else None
         
+        # Notes are parsed in worker processes; duplicate checks run here, in
+        # file order, as each note arrives
+        processed = self.content_processor.iter_process_notes(
+            file_paths, min_content_chars=_MIN_NOTE_CHARS,
+            stat_results=[self._discovered_stats.get(file_path) for file_path in file_paths])
         with tqdm(file_paths, desc="Loading notes", unit="files") as pbar:
-            for i, file_path in enumerate(pbar):
+            for i, (file_path, note) in enumerate(zip(pbar, processed)):
                 pbar.set_postfix(loaded=len(notes))
+                if note is None:
+                    # Failure already logged by the processor
+                    continue
                 try:
-                    note = processor.process_note(file_path)
-                    
                     # Enhanced duplicate detection
                     # 1. Check content hash (for identical content)
-                    content_hash = hash(note.content.strip().lower())
+                    content_hash = _content_fingerprint(note.content)
                     if content_hash in processed_content_hashes:
                         logger.warning(f"Skipping duplicate content: {note.title} (identical content)")
                         continue
@@ -192,18 +328,23 @@ class ObsidianCurator:
                     if normalized_title in processed_titles:
                         logger.warning(f"Skipping duplicate title: {note.title} (similar title)")
                         continue
+                    if similar_titles is not None and similar_titles.contains_similar(normalized_title):
+                        logger.warning(f"Skipping duplicate title: {note.title} (near-duplicate title)")
+                        continue
                     
                     # 3. Check if content is too short to be meaningful (except audio content)
-                    if len(note.content.strip()) < 100 and note.content_type != "audio_annotation":
-                        logger.warning(f"Skipping minimal content: {note.title} ({len(note.content.strip())} chars)")
+                    if note.stripped_length < _MIN_NOTE_CHARS and note.content_type != "audio_annotation":
+                        logger.warning(f"Skipping minimal content: {note.title} ({note.stripped_length} chars)")
                         continue
                     
                     processed_content_hashes.add(content_hash)
                     processed_titles.add(normalized_title)
+                    if similar_titles is not None:
+                        similar_titles.add(normalized_title)
                     notes.append(note)
                     
                     # Log progress
-                    logger.info(f"Processed note {i+1}/{total_files}: {note.title[:50]}...")
+                    logger.debug(f"Processed note {i+1}/{total_files}: {note.title[:50]}...")
                     
                 except Exception as e:
                     logger.warning(f"Failed to process {file_path}: {e}")
@@ -214,11 +355,18 @@ class ObsidianCurator:
     
     def _normalize_title(self, title: str) -> str:
         """Normalize title for duplicate detection."""
-        import re
         # Convert to lowercase, remove special characters, normalize whitespace
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        normalized = title.lower().translate(_ASCII_NON_WORD_TABLE)
+        if not normalized.isascii():
+            normalized = _NON_WORD_RE.sub('', normalized)
+        return _WHITESPACE_RE.sub(' ', normalized).strip()
+
+    def _safe_filename_stem(self, title: str) -> str:
+        """Turn a note title into a lowercase, underscore-separated filename stem."""
+        safe_title = title.translate(_ASCII_UNSAFE_FILENAME_TABLE)
+        if not safe_title.isascii():
+            safe_title = _UNSAFE_FILENAME_RE.sub('', safe_title)
+        return safe_title.rstrip().replace(' ', '_').lower()
 
     def _discover_notes(self, input_path: Path) -> List[Note]:
         """Discover and load notes from the input vault.
@@ -229,55 +377,27 @@ class ObsidianCurator:
         Returns:
             List of discovered Note objects
         """
-        notes = []
-        valid_files = discover_markdown_files(input_path)
+        discovered = discover_markdown_files_with_stats(input_path)
 
-        logger.info(f"Found {len(valid_files)} valid markdown files")
+        logger.info(f"Found {len(discovered)} valid markdown files")
         
-        # Process files with progress bar
-        with tqdm(valid_files, desc="Loading notes", unit="files") as pbar:
-            for file_path in pbar:
-                try:
-                    note = self.content_processor.process_note(file_path)
-                    notes.append(note)
-                    pbar.set_postfix({"loaded": len(notes)})
-                except Exception as e:
-                    logger.warning(f"Failed to process {file_path}: {e}")
-                    continue
+        # Parsing and cleaning are CPU-bound, so files are spread over worker
+        # processes; failures are logged and skipped by the processor
+        notes = self.content_processor.process_notes(
+            [file_path for file_path, _ in discovered],
+            stat_results=[stat_result for _, stat_result in discovered])
         
         logger.info(f"Successfully loaded {len(notes)} notes")
         return notes
     
-    def _process_notes(self, notes: List[Note]) -> List[Note]:
-        """Process notes through content cleaning and enhancement.
-        
-        Args:
-            notes: List of notes to process
-            
-        Returns:
-            List of processed notes
-        """
-        processed_notes = []
-        
-        with tqdm(notes, desc="Processing content", unit="notes") as pbar:
-            for note in pbar:
-                try:
-                    # Content is already processed in content_processor.process_note()
-                    # This step could add additional processing if needed
-                    processed_notes.append(note)
-                    pbar.set_postfix({"processed": len(processed_notes)})
-                except Exception as e:
-                    logger.warning(f"Failed to process note {note.title}: {e}")
-                    continue
-        
-        logger.info(f"Processed {len(processed_notes)} notes")
-        return processed_notes
-    
-    def _analyze_notes(self, notes: List[Note]) -> List[CurationResult]:
+    def _analyze_notes(self, notes: List[Note], output_path: Optional[Path] = None) -> List[CurationResult]:
         """Analyze notes using AI for quality and theme assessment.
         
         Args:
             notes: List of notes to analyze
+            output_path: Final vault location; curated notes are saved to a
+                temporary directory next to it (in the current working
+                directory if not given)
             
         Returns:
             List of curation results
@@ -285,18 +405,20 @@ class ObsidianCurator:
         curation_results = []
         
         # Create output directory structure for immediate saving
-        from .theme_classifier import ThemeClassifier
         from .vault_organizer import VaultOrganizer
         
-        theme_classifier = ThemeClassifier()
+        # The classifier that later builds the vault, so its theme mapping
+        # memo is shared and saved notes land in the same theme folders
+        theme_classifier = self.theme_classifier
         vault_organizer = VaultOrganizer(self.config)
         
         # Create temporary output directory for immediate saving
-        # Use a more specific path that includes the target directory
-        temp_dir_name = f"temp_curated_vault_{int(time.time())}"
-        # Create temp directory in the current working directory for consistency
-        temp_output_path = Path.cwd() / temp_dir_name
-        temp_output_path.mkdir(exist_ok=True)
+        temp_dir_name = f"{_TEMP_VAULT_PREFIX}{int(time.time())}"
+        # Next to the output vault, the temp directory is on the same filesystem,
+        # so moving it into place is a rename rather than a copy of every note
+        temp_parent = output_path.parent if output_path is not None else Path.cwd()
+        temp_output_path = temp_parent / temp_dir_name
+        temp_output_path.mkdir(parents=True, exist_ok=True)
         
         # Store the temporary directory path for later use
         self._temp_output_path = temp_output_path.resolve()  # Use absolute path
@@ -310,77 +432,65 @@ class ObsidianCurator:
         logger.info(f"Starting analysis of {len(notes)} notes")
         logger.info(f"Temporary directory for saving: {temp_output_path}")
         
-        with tqdm(notes, desc="AI analysis", unit="notes") as pbar:
-            for note in pbar:
-                try:
-                    # Perform AI analysis with enhanced metrics
-                    quality_scores, themes, content_structure, curation_reason = self.ai_analyzer.analyze_note(note)
-                    
-                    # Determine if note should be curated
-                    content_length = len(note.content) if note.content else 0
-                    is_curated = self._should_curate(quality_scores, themes, content_length)
-                    
-                    # Create curation result with enhanced metrics
-                    result = CurationResult(
-                        note=note,
-                        cleaned_content=note.content,  # Use the already cleaned content from processor
-                        quality_scores=quality_scores,
-                        themes=themes,
-                        content_structure=content_structure,  # NEW: Include content structure
-                        is_curated=is_curated,
-                        curation_reason=curation_reason,
-                        processing_notes=[]
-                    )
-                    
+        # Reuse earlier analyses of unchanged (or, if enabled, near-duplicate) notes
+        analysis_cache = self._open_analysis_cache()
+        semantic_cache = self._open_semantic_cache()
+        
+        # Build the analyzer on this thread: cached_property does not lock on
+        # Python 3.12+, so first access from the workers could build several
+        ai_analyzer = self.ai_analyzer
+        
+        # AI analysis is I/O-bound (waiting on the model server), so batches of
+        # notes are analyzed concurrently; curated notes are saved on separate
+        # threads so disk writes overlap the remaining analysis. The analyzer's
+        # sub-analysis threads are shut down once analysis ends
+        batch_size = self.config.llm_batch_size
+        results_by_index = {}
+        curated_count = 0
+        with closing(ai_analyzer), \
+                ThreadPoolExecutor(max_workers=self.config.max_workers) as executor, \
+                ThreadPoolExecutor(max_workers=self.config.write_workers,
+                                   thread_name_prefix="note-save") as save_executor, \
+                tqdm(total=len(notes), desc="AI analysis", unit="notes") as pbar:
+            futures = {executor.submit(self._analyze_note_batch, notes[start:start + batch_size],
+                                       analysis_cache, semantic_cache): start
+                       for start in range(0, len(notes), batch_size)}
+            
+            for future in as_completed(futures):
+                for offset, result in enumerate(future.result()):
+                    results_by_index[futures[future] + offset] = result
                     curation_results.append(result)
+                    curated_count += result.is_curated
+                    note = result.note
                     
-                    # Save curated notes immediately to avoid losing work
-                    if is_curated and note.title not in saved_notes:
-                        try:
-                            self._save_note_immediately(result, temp_output_path, theme_classifier)
-                            saved_notes.add(note.title)
-                            logger.info(f"Saved note immediately: {note.title}")
-                        except Exception as save_error:
-                            logger.warning(f"Failed to save note {note.title}: {save_error}")
+                    # Save curated notes immediately to avoid losing work; save
+                    # failures are logged by _save_note_immediately
+                    if result.is_curated and note.title not in saved_notes:
+                        save_executor.submit(self._save_note_immediately, result,
+                                             temp_output_path, theme_classifier)
+                        saved_notes.add(note.title)
+                        logger.debug(f"Queued note for saving: {note.title}")
                     
-                    # Update progress
-                    curated_count = sum(1 for r in curation_results if r.is_curated)
+                    # Update progress; the postfix is drawn by update(), which
+                    # limits redraws to tqdm's refresh interval
                     pbar.set_postfix({
                         "analyzed": len(curation_results),
                         "curated": curated_count,
                         "saved": len(saved_notes),
                         "rate": f"{(curated_count/len(curation_results)*100):.1f}%"
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to analyze note {note.title}: {e}")
-                    # Create a failed result with enhanced defaults
-                    from .models import QualityScore, Theme, ContentStructure
-                    default_scores = QualityScore(
-                        overall=0.0, relevance=0.0, completeness=0.0, 
-                        credibility=0.0, clarity=0.0,
-                        analytical_depth=0.0, evidence_quality=0.0, critical_thinking=0.0,
-                        argument_structure=0.0, practical_value=0.0
-                    )
-                    default_structure = ContentStructure(
-                        has_clear_problem=False, has_evidence=False, has_multiple_perspectives=False,
-                        has_actionable_conclusions=False, logical_flow_score=0.0,
-                        argument_coherence=0.0, conclusion_strength=0.0
-                    )
-                    result = CurationResult(
-                        note=note,
-                        cleaned_content=note.content,
-                        quality_scores=default_scores,
-                        themes=[],
-                        content_structure=default_structure,  # NEW: Include content structure
-                        is_curated=False,
-                        curation_reason=f"Analysis failed: {str(e)}",
-                        processing_notes=[f"AI analysis failed: {str(e)}"]
-                    )
-                    curation_results.append(result)
-                    continue
+                    }, refresh=False)
+                    pbar.update(1)
+        
+        # Keep results in input order regardless of completion order
+        curation_results = [results_by_index[index] for index in range(len(notes))]
+        
+        if analysis_cache is not None:
+            analysis_cache.log_stats()
+            analysis_cache.close()
+        if semantic_cache is not None:
+            logger.info(f"Semantic cache: {semantic_cache.hits} near-duplicate notes reused an analysis")
+            semantic_cache.close()
         
-        curated_count = sum(1 for r in curation_results if r.is_curated)
         rejected_count = len(curation_results) - curated_count
         logger.info(f"Analyzed {len(curation_results)} notes: {curated_count} curated, {rejected_count} rejected")
         logger.info(f"Saved {len(saved_notes)} notes to temporary directory: {temp_output_path}")
@@ -388,15 +498,241 @@ class ObsidianCurator:
         # Store the temporary directory path for later use
         self._temp_output_path = temp_output_path
         
-        # Log detailed curation decisions for analysis
-        for result in curation_results:
-            status = "CURATED" if result.is_curated else "REJECTED"
-            quality = result.quality_scores.overall
-            relevance = result.quality_scores.relevance
-            logger.info(f"{status}: '{result.note.title[:50]}...' (Q:{quality:.2f}, R:{relevance:.2f}) - {result.curation_reason}")
-        
         return curation_results
     
+    def _save_curation_decisions(self, curation_results: List[CurationResult], path: Path) -> None:
+        """Write one JSON line per curation decision.
+        
+        Args:
+            curation_results: Results to record
+            path: Destination file (its directory is created if needed)
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open('w', encoding='utf-8') as f:
+                f.writelines(
+                    json.dumps({
+                        "title": result.note.title,
+                        "file_path": str(result.note.file_path),
+                        "status": "CURATED" if result.is_curated else "REJECTED",
+                        "quality": round(result.quality_scores.overall, 2),
+                        "relevance": round(result.quality_scores.relevance, 2),
+                        "reason": result.curation_reason,
+                    }, ensure_ascii=False) + "\n"
+                    for result in curation_results
+                )
+            logger.info(f"Saved {len(curation_results)} curation decisions to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to save curation decisions: {e}")
+    
+    def _open_analysis_cache(self) -> Optional[AnalysisCache]:
+        """Open the persistent analysis cache if caching is enabled.
+        
+        Returns:
+            The cache, or None if disabled or it cannot be opened
+        """
+        if not self.config.use_cache:
+            return None
+        
+        cache_dir = self.config.cache_dir or DEFAULT_CACHE_DIR
+        try:
+            return AnalysisCache(cache_dir, model_fingerprint(self.config),
+                                 max_entries=self.config.cache_max_entries)
+        except Exception as e:
+            logger.warning(f"Analysis cache unavailable at {cache_dir}, continuing without it: {e}")
+            return None
+    
+    def _open_semantic_cache(self) -> Optional[SemanticAnalysisCache]:
+        """Open the embedding-similarity cache if a threshold is configured.
+        
+        Returns:
+            The cache, or None if disabled or it cannot be opened
+        """
+        if not self.config.use_cache or self.config.semantic_cache_threshold is None:
+            return None
+        
+        cache_dir = self.config.cache_dir or DEFAULT_CACHE_DIR
+        try:
+            return SemanticAnalysisCache(cache_dir, model_fingerprint(self.config),
+                                         self.config.embedding_model,
+                                         self.config.semantic_cache_threshold,
+                                         max_entries=self.config.cache_max_entries)
+        except Exception as e:
+            logger.warning(f"Semantic cache unavailable at {cache_dir}, continuing without it: {e}")
+            return None
+    
+    def _analyze_note_batch(self, notes: List[Note], analysis_cache: Optional[AnalysisCache] = None,
+                            semantic_cache: Optional[SemanticAnalysisCache] = None) -> List[CurationResult]:
+        """Analyze a batch of notes, sending their cache misses to the model together.
+        
+        Safe to run from worker threads. If the batched analysis fails, every
+        note in the batch is analyzed on its own so one failure stays isolated.
+        
+        Args:
+            notes: Notes to analyze
+            analysis_cache: Cache consulted before, and filled after, the AI analysis
+            semantic_cache: Near-duplicate cache consulted on an exact-cache miss
+            
+        Returns:
+            Curation results in the same order as the notes
+        """
+        # Notes too short to ever be curated are rejected without an AI call
+        too_short = [self._too_short_to_curate(len(note.content or "")) for note in notes]
+        if any(too_short):
+            analyzed = iter(self._analyze_note_batch(
+                [note for note, short in zip(notes, too_short) if not short],
+                analysis_cache, semantic_cache))
+            return [self._rejected_result(note, f"Too short to curate ({len(note.content or '')} chars)")
+                    if short else next(analyzed)
+                    for note, short in zip(notes, too_short)]
+        
+        if len(notes) > 1:
+            try:
+                analyses = self._cached_analyses(notes, analysis_cache, semantic_cache)
+            except Exception as e:
+                logger.warning(f"Batched analysis of {len(notes)} notes failed, analyzing them individually: {e}")
+            else:
+                return [self._analyze_single_note(note, analysis=analysis)
+                        for note, analysis in zip(notes, analyses)]
+        
+        return [self._analyze_single_note(note, analysis_cache, semantic_cache) for note in notes]
+    
+    def _cached_analyses(self, notes: List[Note], analysis_cache: Optional[AnalysisCache] = None,
+                         semantic_cache: Optional[SemanticAnalysisCache] = None) -> List[AnalysisResult]:
+        """Return the AI analysis of each note, reusing cached analyses where possible.
+        
+        Notes with no cached analysis are analyzed in one batched call and the
+        results are added to the caches.
+        
+        Args:
+            notes: Notes to analyze
+            analysis_cache: Cache consulted before, and filled after, the AI analysis
+            semantic_cache: Near-duplicate cache consulted on an exact-cache miss
+            
+        Returns:
+            Analyses in the same order as the notes
+        """
+        cached_analyses = [analysis_cache.get(note) if analysis_cache is not None else None
+                           for note in notes]
+        vectors = [None] * len(notes)
+        if semantic_cache is not None:
+            # Embed every exact-cache miss of the batch in one request
+            unmatched = [i for i, cached in enumerate(cached_analyses) if cached is None]
+            for i, vector in zip(unmatched, semantic_cache.embed_many([notes[i] for i in unmatched])):
+                vectors[i] = vector
+                cached_analyses[i] = semantic_cache.get(notes[i], vector)
+                if cached_analyses[i] is not None and analysis_cache is not None:
+                    analysis_cache.set(notes[i], cached_analyses[i])
+        lookups = list(zip(cached_analyses, vectors))
+        
+        missing = [note for note, (cached, _) in zip(notes, lookups) if cached is None]
+        fresh = iter(self.ai_analyzer.analyze_notes(missing))
+        
+        analyses = []
+        for note, (cached, vector) in zip(notes, lookups):
+            if cached is None:
+                cached = next(fresh)
+                # Failed analyses, and those that fell back to heuristics, are
+                # retried on the next run rather than cached
+                if not used_fallback(cached):
+                    if analysis_cache is not None:
+                        analysis_cache.set(note, cached)
+                    if semantic_cache is not None:
+                        semantic_cache.set(note, vector, cached)
+            analyses.append(cached)
+        return analyses
+    
+    def _analyze_single_note(self, note: Note, analysis_cache: Optional[AnalysisCache] = None,
+                             semantic_cache: Optional[SemanticAnalysisCache] = None,
+                             analysis: Optional[AnalysisResult] = None) -> CurationResult:
+        """Analyze one note and decide whether it is curated.
+        
+        Safe to run from worker threads. Analysis errors are turned into a
+        rejected result instead of being raised.
+        
+        Args:
+            note: Note to analyze
+            analysis_cache: Cache consulted before, and filled after, the AI analysis
+            semantic_cache: Near-duplicate cache consulted on an exact-cache miss
+            analysis: Analysis already obtained for this note; skips the caches and the AI call
+            
+        Returns:
+            Curation result for the note
+        """
+        try:
+            # Perform AI analysis with enhanced metrics, unless an identical note was analyzed before
+            if analysis is None:
+                analysis = self._cached_analyses([note], analysis_cache, semantic_cache)[0]
+            quality_scores, themes, content_structure, curation_reason = analysis
+            
+            # Determine if note should be curated
+            content_length = len(note.content) if note.content else 0
+            is_curated = self._should_curate(quality_scores, themes, content_length)
+            
+            # Create curation result with enhanced metrics
+            return CurationResult(
+                note=note,  # Content was already cleaned by the processor
+                quality_scores=quality_scores,
+                themes=themes,
+                content_structure=content_structure,  # NEW: Include content structure
+                is_curated=is_curated,
+                curation_reason=curation_reason,
+                processing_notes=[]
+            )
+            
+        except Exception as e:
+            logger.warning(f"Failed to analyze note {note.title}: {e}")
+            return self._rejected_result(note, f"Analysis failed: {str(e)}",
+                                         [f"AI analysis failed: {str(e)}"])
+    
+    def _rejected_result(self, note: Note, reason: str,
+                         processing_notes: Optional[List[str]] = None) -> CurationResult:
+        """Build a rejected result with zero scores for a note that was not analyzed.
+        
+        Args:
+            note: The note
+            reason: Curation reason to record
+            processing_notes: Processing notes to record
+            
+        Returns:
+            Rejected curation result
+        """
+        from .models import QualityScore, ContentStructure
+        default_scores = QualityScore(
+            overall=0.0, relevance=0.0, completeness=0.0, 
+            credibility=0.0, clarity=0.0,
+            analytical_depth=0.0, evidence_quality=0.0, critical_thinking=0.0,
+            argument_structure=0.0, practical_value=0.0
+        )
+        default_structure = ContentStructure(
+            has_clear_problem=False, has_evidence=False, has_multiple_perspectives=False,
+            has_actionable_conclusions=False, logical_flow_score=0.0,
+            argument_coherence=0.0, conclusion_strength=0.0
+        )
+        return CurationResult(
+            note=note,
+            quality_scores=default_scores,
+            themes=[],
+            content_structure=default_structure,  # NEW: Include content structure
+            is_curated=False,
+            curation_reason=reason,
+            processing_notes=processing_notes or []
+        )
+    
+    def _too_short_to_curate(self, content_length: int) -> bool:
+        """Check whether _should_curate rejects a note on length alone.
+        
+        Every acceptance path of :meth:`_should_curate` needs either more than
+        150 characters or at least ``min_content_length``, whatever the scores.
+        
+        Args:
+            content_length: Length of the note content in characters
+            
+        Returns:
+            True if the note cannot be curated
+        """
+        return content_length <= 150 and content_length < self._curation_thresholds[3]
+    
     def _should_curate(self, quality_scores, themes, content_length: int = 0) -> bool:
         """Determine if a note should be curated based on scores and themes.
         
@@ -409,24 +745,12 @@ class ObsidianCurator:
             True if note should be curated
         """
         try:
-            # Enhanced quality thresholds for analytical content
-            meets_quality = quality_scores.overall >= self.config.quality_threshold
-            meets_relevance = quality_scores.relevance >= self.config.relevance_threshold
-            meets_analytical_depth = quality_scores.analytical_depth >= getattr(self.config, 'analytical_depth_threshold', 0.65)
-            
-            # Check minimum content length for usefulness
-            meets_length_requirement = content_length >= getattr(self.config, 'min_content_length', 300)
+            quality_threshold, relevance_threshold, depth_threshold, min_length = self._curation_thresholds
             
-            # Professional writing quality assessment (higher standards)
-            professional_writing_score = (
-                quality_scores.analytical_depth + 
-                quality_scores.evidence_quality + 
-                quality_scores.critical_thinking + 
-                quality_scores.argument_structure
-            ) / 4.0
-            
-            professional_threshold = getattr(self.config, 'professional_writing_threshold', 0.65)
-            meets_professional = professional_writing_score >= professional_threshold
+            # Enhanced quality thresholds for analytical content
+            meets_quality = quality_scores.overall >= quality_threshold
+            meets_relevance = quality_scores.relevance >= relevance_threshold
+            meets_analytical_depth = quality_scores.analytical_depth >= depth_threshold
             
             # Theme relevance check
             has_relevant_themes = False
@@ -436,13 +760,8 @@ class ObsidianCurator:
                 has_relevant_themes = len(confident_themes) > 0
                 
                 # If target themes are specified, check alignment
-                if self.config.target_themes:
-                    theme_alignment = any(
-                        any(target.lower() in theme.name.lower() or 
-                             any(target.lower() in keyword.lower() for keyword in theme.keywords)
-                             for target in self.config.target_themes)
-                        for theme in confident_themes
-                    )
+                if self._target_themes_lower:
+                    theme_alignment = self._matches_target_themes(confident_themes)
                     has_relevant_themes = has_relevant_themes and theme_alignment
             
             # Intelligent curation decision logic
@@ -460,7 +779,7 @@ class ObsidianCurator:
             )
             
             # 4. Content length considerations
-            substantial_content = content_length >= self.config.min_content_length
+            substantial_content = content_length >= min_length
             
             # Decision logic: curate if any criteria met
             should_curate = False
@@ -482,14 +801,23 @@ class ObsidianCurator:
             if not should_curate:
                 curation_reasons.append("Did not meet minimum quality or relevance criteria")
             
-            # Detailed debug logging
-            logger.info(f"Curation decision details:")
-            logger.info(f"  Quality scores: overall={quality_scores.overall:.2f}, relevance={quality_scores.relevance:.2f}")
-            logger.info(f"  Thresholds: quality={self.config.quality_threshold}, relevance={self.config.relevance_threshold}")
-            logger.info(f"  Meets quality: {meets_quality}, meets relevance: {meets_relevance}")
-            logger.info(f"  Themes: {len(themes)} found, relevant: {has_relevant_themes}")
-            logger.info(f"  Content length: {content_length} chars")
-            logger.info(f"  Final decision: {'CURATE' if should_curate else 'REJECT'}")
+            # Detailed debug logging; loguru only formats the arguments if a
+            # sink accepts DEBUG records
+            logger.debug(
+                "Curation decision details:\n"
+                "  Quality scores: overall={:.2f}, relevance={:.2f}\n"
+                "  Thresholds: quality={}, relevance={}\n"
+                "  Meets quality: {}, meets relevance: {}\n"
+                "  Themes: {} found, relevant: {}\n"
+                "  Content length: {} chars\n"
+                "  Final decision: {}",
+                quality_scores.overall, quality_scores.relevance,
+                quality_threshold, relevance_threshold,
+                meets_quality, meets_relevance,
+                len(themes), has_relevant_themes,
+                content_length,
+                'CURATE' if should_curate else 'REJECT',
+            )
             
             return should_curate
             
@@ -497,45 +825,66 @@ class ObsidianCurator:
             logger.error(f"Error in curation decision for note: {e}")
             return False
     
+    def _matches_target_themes(self, themes: List[Theme]) -> bool:
+        """Check whether any theme's name or keywords mention a target theme.
+        
+        Args:
+            themes: Themes to check
+            
+        Returns:
+            True if some target theme is a substring of a name or a keyword
+        """
+        # Lowercase each name and distinct keyword once for all targets
+        terms = {theme.name.lower() for theme in themes}
+        terms.update(keyword.lower() for theme in themes for keyword in theme.keywords)
+        return any(target in term for target in self._target_themes_lower for term in terms)
+
     def _save_note_immediately(self, result, output_path, theme_classifier):
         """Save a curated note immediately to disk to avoid losing work."""
         try:
-            logger.info(f"Attempting to save note immediately: {result.note.title}")
-            logger.info(f"Output path: {output_path}")
-            logger.info(f"Output path exists: {output_path.exists()}")
+            # Per-note details are DEBUG; lazy arguments keep the filesystem
+            # checks from running unless they are logged
+            lazy_logger = logger.opt(lazy=True)
+            logger.debug("Attempting to save note immediately: {}", result.note.title)
+            logger.debug("Output path: {}", output_path)
+            lazy_logger.debug("Output path exists: {}", output_path.exists)
             
             # Classify themes and create folder structure
             theme_groups = theme_classifier.classify_themes([result])
-            logger.info(f"Theme groups: {theme_groups}")
+            logger.debug("Theme groups: {}", theme_groups)
             
             # Create theme folders
             for theme_name, notes in theme_groups.items():
                 theme_path = output_path / theme_name
-                logger.info(f"Creating theme path: {theme_path}")
-                theme_path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Theme path created: {theme_path.exists()}")
+                if theme_path not in self._created_theme_dirs:
+                    logger.debug("Creating theme path: {}", theme_path)
+                    theme_path.mkdir(parents=True, exist_ok=True)
+                    self._created_theme_dirs.add(theme_path)
                 
                 # Save note to appropriate theme folder
                 for note_result in notes:
                     if note_result.is_curated:
                         # Create filename
-                        safe_title = "".join(c for c in note_result.note.title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                        safe_title = safe_title.replace(' ', '_').lower()
-                        filename = f"{safe_title}.md"
+                        filename = f"{self._safe_filename_stem(note_result.note.title)}.md"
                         file_path = theme_path / filename
-                        logger.info(f"Creating file: {file_path}")
+                        logger.debug("Creating file: {}", file_path)
                         
                         # Create curated note content
                         curated_content = self._create_curated_note_content(note_result)
-                        logger.info(f"Content length: {len(curated_content)} characters")
+                        logger.debug("Content length: {} characters", len(curated_content))
                         
-                        # Write to file immediately
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(curated_content)
+                        # Write to a temporary file and rename it into place, so
+                        # the note is never left half-written
+                        fd, tmp_name = tempfile.mkstemp(dir=theme_path, suffix=".tmp")
+                        try:
+                            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                                f.write(curated_content)
+                            os.replace(tmp_name, file_path)
+                        except BaseException:
+                            os.unlink(tmp_name)
+                            raise
                         
-                        logger.info(f"Successfully saved note immediately: {file_path}")
-                        logger.info(f"File exists after save: {file_path.exists()}")
-                        logger.info(f"File size: {file_path.stat().st_size} bytes")
+                        logger.debug("Successfully saved note immediately: {}", file_path)
                         
         except Exception as e:
             logger.error(f"Failed to save note immediately: {e}")
@@ -548,43 +897,42 @@ class ObsidianCurator:
         quality = result.quality_scores
         themes = result.themes
         
-        # Create YAML frontmatter
-        frontmatter = f"""---
-title: {note.title}
-curated_date: {datetime.now().isoformat()}
-        source: {note.source_url or 'Unknown'}
-tags:
-"""
-        
-        for theme in themes:
-            frontmatter += f"  - {theme.name}\n"
-        
-        frontmatter += f"language: {note.metadata.get('language', 'en')}\n---\n\n"
-        
-        # Create content
-        content = f"# {note.title}\n\n"
-        content += "## Quality Assessment\n\n"
-        content += f"- **Overall Quality**: {quality.overall:.2f}/1.0\n"
-        content += f"- **Relevance**: {quality.relevance:.2f}/1.0\n"
-        content += f"- **Analytical Depth**: {quality.analytical_depth:.2f}/1.0\n"
-        content += f"- **Critical Thinking**: {quality.critical_thinking:.2f}/1.0\n"
-        content += f"- **Evidence Quality**: {quality.evidence_quality:.2f}/1.0\n"
-        content += f"- **Argument Structure**: {quality.argument_structure:.2f}/1.0\n"
-        content += f"- **Practical Value**: {quality.practical_value:.2f}/1.0\n\n"
-        
-        content += "## Identified Themes\n\n"
-        for theme in themes:
-            content += f"- **{theme.name}** (confidence: {theme.confidence:.2f})\n"
-        
-        content += "\n## Content\n\n"
-        content += note.content
-        
-        return frontmatter + content
+        parts = [
+            # YAML frontmatter
+            "---\n",
+            f"title: {note.title}\n",
+            f"curated_date: {datetime.now().isoformat()}\n",
+            f"source: {note.source_url or 'Unknown'}\n",
+            "tags:\n",
+        ]
+        parts.extend(f"  - {theme.name}\n" for theme in themes)
+        parts += [
+            f"language: {note.metadata.get('language', 'en')}\n---\n\n",
+            
+            # Content
+            f"# {note.title}\n\n",
+            "## Quality Assessment\n\n",
+            f"- **Overall Quality**: {quality.overall:.2f}/1.0\n",
+            f"- **Relevance**: {quality.relevance:.2f}/1.0\n",
+            f"- **Analytical Depth**: {quality.analytical_depth:.2f}/1.0\n",
+            f"- **Critical Thinking**: {quality.critical_thinking:.2f}/1.0\n",
+            f"- **Evidence Quality**: {quality.evidence_quality:.2f}/1.0\n",
+            f"- **Argument Structure**: {quality.argument_structure:.2f}/1.0\n",
+            f"- **Practical Value**: {quality.practical_value:.2f}/1.0\n\n",
+            "## Identified Themes\n\n",
+        ]
+        parts.extend(f"- **{theme.name}** (confidence: {theme.confidence:.2f})\n" for theme in themes)
+        parts += ["\n## Content\n\n", note.content]
+        
+        return "".join(parts)
     
     def _create_curated_vault(self, curation_results: List[CurationResult], 
                              output_path: Path) -> CurationStats:
         """Create the curated vault with organized content.
         
+        The curation decisions for all results, including every batch of a
+        batched run, are recorded in the vault's metadata folder.
+        
         Args:
             curation_results: List of curation results
             output_path: Path to output vault
@@ -602,6 +950,7 @@ tags:
         
         if not curated_results:
             logger.warning("No notes passed curation criteria")
+            self._save_curation_decisions(curation_results, output_path / "metadata" / _DECISIONS_FILENAME)
             return CurationStats(
                 total_notes=len(curation_results),
                 curated_notes=0,
@@ -627,28 +976,20 @@ tags:
             latest_temp_dir = None
         
         if not latest_temp_dir:
-            # Fallback: Look for temporary directories that might contain saved notes
-            import glob
-            temp_dirs = glob.glob("temp_curated_vault_*")
-            logger.info(f"Found {len(temp_dirs)} temporary directories: {temp_dirs}")
-            
-            if temp_dirs:
-                # Use the most recent temporary directory
-                latest_temp_dir = max(temp_dirs, key=lambda x: int(x.split('_')[-1]))
-                latest_temp_dir = Path(latest_temp_dir)
+            # Fallback: Look for temporary directories that might contain saved
+            # notes, next to the output vault or (for older runs) in the cwd
+            latest_temp_dir = (_find_latest_temp_vault(output_path.parent)
+                               or _find_latest_temp_vault(Path.cwd()))
+            if latest_temp_dir is not None:
                 logger.info(f"Using fallback temporary directory: {latest_temp_dir}")
             else:
-                latest_temp_dir = None
                 logger.warning("No temporary directories found")
         
         if latest_temp_dir and latest_temp_dir.exists():
             logger.info(f"Found temporary directory with saved notes: {latest_temp_dir}")
-            logger.info(f"Temporary directory contents:")
-            for item in latest_temp_dir.rglob("*"):
-                if item.is_file():
-                    logger.info(f"  File: {item.relative_to(latest_temp_dir)} ({item.stat().st_size} bytes)")
-                elif item.is_dir():
-                    logger.info(f"  Directory: {item.relative_to(latest_temp_dir)}")
+            # Walking the whole directory is only worth it when debugging
+            logger.opt(lazy=True).debug("Temporary directory contents:\n{}",
+                                        lambda: _describe_directory(latest_temp_dir))
             
             # Move saved notes to final output location
             import shutil
@@ -687,8 +1028,9 @@ tags:
         
         # Create curated vault
         stats = self.vault_organizer.create_curated_vault(
-            curation_results, output_path, vault_structure
+            curation_results, output_path, vault_structure, theme_groups
         )
+        self._save_curation_decisions(curation_results, output_path / "metadata" / _DECISIONS_FILENAME)
         
         return stats
     
@@ -699,18 +1041,19 @@ tags:
             metadata_path = output_path / "metadata"
             metadata_path.mkdir(exist_ok=True)
             
-            # Calculate statistics
-            total_notes = len(curation_results)
-            curated_notes = sum(1 for r in curation_results if r.is_curated)
-            rejected_notes = total_notes - curated_notes
+            # Record detailed curation decisions for analysis
+            self._save_curation_decisions(curation_results, metadata_path / _DECISIONS_FILENAME)
             
-            # Create theme distribution
-            themes_distribution = {}
+            # Count curated notes and their themes in a single pass
+            total_notes = len(curation_results)
+            curated_notes = 0
+            theme_counts = Counter()
             for result in curation_results:
                 if result.is_curated:
-                    for theme in result.themes:
-                        theme_name = theme.name
-                        themes_distribution[theme_name] = themes_distribution.get(theme_name, 0) + 1
+                    curated_notes += 1
+                    theme_counts.update(theme.name for theme in result.themes)
+            rejected_notes = total_notes - curated_notes
+            themes_distribution = dict(theme_counts)
             
             # Create quality distribution
             quality_distribution = {"0.6-0.8": curated_notes}  # Simplified for now
@@ -727,7 +1070,6 @@ tags:
             )
             
             # Save statistics
-            import json
             with open(metadata_path / "statistics.json", 'w', encoding='utf-8') as f:
                 json.dump(stats.dict(), f, indent=2, default=str)
             
@@ -751,10 +1093,11 @@ tags:
         except Exception as e:
             logger.error(f"Failed to create final metadata: {e}")
             # Return basic stats on error
+            curated_notes = sum(1 for r in curation_results if r.is_curated)
             return CurationStats(
                 total_notes=len(curation_results),
-                curated_notes=sum(1 for r in curation_results if r.is_curated),
-                rejected_notes=sum(1 for r in curation_results if not r.is_curated),
+                curated_notes=curated_notes,
+                rejected_notes=len(curation_results) - curated_notes,
                 processing_time=0.0,
                 themes_distribution={},
                 quality_distribution={}
@@ -772,19 +1115,26 @@ tags:
         Returns:
             ProcessingCheckpoint object
         """
-        import hashlib
-        
         # Create config hash for validation
-        config_str = str(self.config.dict())
-        config_hash = hashlib.md5(config_str.encode()).hexdigest()
-        
         return ProcessingCheckpoint(
             processed_notes=processed_notes,
             total_notes=total_notes,
             current_step=current_step,
-            config_hash=config_hash
+            config_hash=self._config_hash
         )
     
+    @cached_property
+    def _config_hash(self) -> str:
+        """Fingerprint of the configuration for checkpoint validation.
+        
+        Computed once, since the configuration does not change during a run.
+        Keys are sorted so the fingerprint does not depend on field order.
+        The algorithm is part of the value, so checkpoints hashed differently
+        (e.g. with MD5 by older versions) simply count as a changed config.
+        """
+        config_str = json.dumps(self.config.dict(), sort_keys=True, default=str)
+        return "blake2b:" + hashlib.blake2b(config_str.encode(), digest_size=16).hexdigest()
+    
     def resume_from_checkpoint(self, checkpoint: ProcessingCheckpoint) -> bool:
         """Resume processing from a checkpoint.
         
@@ -794,13 +1144,8 @@ tags:
         Returns:
             True if resume is valid, False otherwise
         """
-        import hashlib
-        
         # Validate config hasn't changed
-        config_str = str(self.config.dict())
-        config_hash = hashlib.md5(config_str.encode()).hexdigest()
-        
-        if config_hash != checkpoint.config_hash:
+        if self._config_hash != checkpoint.config_hash:
             logger.warning("Configuration has changed since checkpoint was created")
             return False
         
@@ -823,10 +1168,11 @@ tags:
         """
         logger.info(f"Starting batch processing with batch size: {batch_size}")
         
-        # Discover all notes first
-        all_notes = self._discover_notes(input_path)
+        # Discover all note files first; notes are loaded batch by batch
+        discovered = discover_markdown_files_with_stats(input_path)
+        logger.info(f"Found {len(discovered)} valid markdown files")
         
-        if not all_notes:
+        if not discovered:
             logger.warning("No notes found for batch processing")
             return CurationStats(
                 total_notes=0, curated_notes=0, rejected_notes=0,
@@ -835,23 +1181,33 @@ tags:
         
         # Process in batches
         all_results = []
-        total_batches = (len(all_notes) + batch_size - 1) // batch_size
+        batches = [discovered[start:start + batch_size]
+                   for start in range(0, len(discovered), batch_size)]
+        total_batches = len(batches)
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(all_notes))
-            batch_notes = all_notes[start_idx:end_idx]
-            
-            logger.info(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_notes)} notes)")
-            
-            # Process batch
-            processed_notes = self._process_notes(batch_notes)
-            batch_results = self._analyze_notes(processed_notes)
-            all_results.extend(batch_results)
-            
-            # Log batch progress
-            batch_curated = sum(1 for r in batch_results if r.is_curated)
-            logger.info(f"Batch {batch_num + 1} complete: {batch_curated}/{len(batch_results)} curated")
+        def load_batch(batch: List) -> List[Note]:
+            return self.content_processor.process_notes(
+                [file_path for file_path, _ in batch],
+                stat_results=[stat_result for _, stat_result in batch])
+        
+        # While a batch is analyzed, the next one is read and parsed in the
+        # background, so file I/O overlaps with waiting on the model
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-load") as loader:
+            next_batch = loader.submit(load_batch, batches[0])
+            for batch_num in range(total_batches):
+                batch_notes = next_batch.result()
+                if batch_num + 1 < total_batches:
+                    next_batch = loader.submit(load_batch, batches[batch_num + 1])
+                
+                logger.info(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_notes)} notes)")
+                
+                # Analyze batch
+                batch_results = self._analyze_notes(batch_notes, output_path)
+                all_results.extend(batch_results)
+                
+                # Log batch progress
+                batch_curated = sum(1 for r in batch_results if r.is_curated)
+                logger.info(f"Batch {batch_num + 1} complete: {batch_curated}/{len(batch_results)} curated")
         
         # Create final curated vault
         logger.info("Creating final curated vault...")
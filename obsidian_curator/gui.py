@@ -88,7 +88,7 @@ class CurationWorker(QThread):
             
             # Step 4: AI analysis using CLI logic
             self.progress_updated.emit(50, 100, "Performing AI analysis...")
-            curation_results = curator._analyze_notes(processed_notes)
+            curation_results = curator._analyze_notes(processed_notes, Path(self.output_path))
             
             # Log temporary directory info
             if hasattr(curator, '_temp_output_path'):
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field, validator
@@ -158,11 +159,18 @@ class Note(BaseModel):
             raise ValueError("Title cannot be empty")
         return v.strip()
     
-    @property
+    # Content is not changed after a note is built, so measures of it are
+    # computed once per note
+    @cached_property
     def word_count(self) -> int:
         """Calculate word count of content."""
         return len(self.content.split())
     
+    @cached_property
+    def stripped_length(self) -> int:
+        """Length of the content without surrounding whitespace."""
+        return len(self.content.strip())
+    
     @property
     def is_web_clipping(self) -> bool:
         """Check if note is a web clipping."""
@@ -172,7 +180,7 @@ class Note(BaseModel):
 class CurationResult(BaseModel):
     """Result of curating a single note."""
     note: Note = Field(..., description="Original note")
-    cleaned_content: str = Field(..., description="Cleaned and processed content")
+    cleaned_content: Optional[str] = Field(None, description="Cleaned content, if it differs from the note's content")
     quality_scores: QualityScore = Field(..., description="Quality assessment scores")
     themes: List[Theme] = Field(..., description="Identified themes")
     content_structure: Optional[ContentStructure] = Field(None, description="Analysis of content structure and logical flow")
@@ -181,8 +189,18 @@ class CurationResult(BaseModel):
     processing_notes: List[str] = Field(default_factory=list, description="Processing notes and warnings")
     
     @property
+    def content(self) -> str:
+        """Get the content to publish, falling back to the note's own content."""
+        if self.cleaned_content is not None:
+            return self.cleaned_content
+        return self.note.content
+    
+    @cached_property
     def primary_theme(self) -> Optional[Theme]:
-        """Get the primary theme with highest confidence."""
+        """Get the primary theme with highest confidence.
+        
+        Computed once per result; themes are not changed after a result is built.
+        """
         if not self.themes:
             return None
         return max(self.themes, key=lambda t: t.confidence)
@@ -243,6 +261,26 @@ class CurationConfig(BaseModel):
         le=1.0,
         description="Similarity threshold for fuzzy theme matching",
     )
+    title_similarity_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Trigram similarity above which notes with near-identical titles count as duplicates (None matches exact titles only)",
+    )
+    max_workers: int = Field(default=4, ge=1, description="Number of notes analyzed concurrently by the AI backend")
+    llm_batch_size: int = Field(default=1, ge=1, description="Notes whose quality is scored together in one AI request")
+    concurrent_subanalyses: bool = Field(default=True, description="Run a note's quality, theme and structure analyses concurrently")
+    write_workers: int = Field(default=8, ge=1, description="Number of curated notes written to the output vault concurrently")
+    use_cache: bool = Field(default=True, description="Reuse AI analysis results for notes whose content is unchanged")
+    cache_dir: Optional[Path] = Field(default=None, description="Directory for the analysis cache (defaults to ~/.obsidian_curator/cache)")
+    cache_max_entries: Optional[int] = Field(default=None, ge=1, description="Maximum analyses kept in the cache (least recently used are evicted) and in the semantic cache (oldest are dropped); unbounded if unset")
+    semantic_cache_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity above which a near-duplicate note reuses a cached analysis (None disables)",
+    )
+    embedding_model: str = Field(default="nomic-embed-text", description="Ollama model used for semantic cache embeddings")
     
     class Config:
         """Pydantic configuration."""
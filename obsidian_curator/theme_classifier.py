@@ -68,6 +68,11 @@ class ThemeClassifier:
             "government institutions": "institutions",
             "regulatory bodies": "institutions"
         }
+        
+        # Hierarchy mapping per theme name; a vault's notes mostly share a few
+        # recurring themes, and a note may be classified again when the vault
+        # is built
+        self._hierarchy_cache: Dict[str, str] = {}
     
     def classify_themes(self, curation_results: List[CurationResult]) -> Dict[str, List[CurationResult]]:
         """Classify curation results by primary themes.
@@ -100,6 +105,20 @@ class ThemeClassifier:
     def _map_to_hierarchy(self, theme_name: str) -> str:
         """Map a theme name to our predefined hierarchy.
         
+        Args:
+            theme_name: Theme name to map
+            
+        Returns:
+            Mapped theme name from hierarchy
+        """
+        mapped = self._hierarchy_cache.get(theme_name)
+        if mapped is None:
+            mapped = self._hierarchy_cache[theme_name] = self._lookup_hierarchy(theme_name)
+        return mapped
+    
+    def _lookup_hierarchy(self, theme_name: str) -> str:
+        """Search the theme hierarchy for a theme name (uncached).
+        
         Args:
             theme_name: Theme name to map
             
@@ -245,44 +264,43 @@ class ThemeClassifier:
         Returns:
             Markdown content for theme analysis
         """
-        analysis = "# Theme Analysis Report\n\n"
-        analysis += f"Generated on: {vault_structure.root_path}\n\n"
+        parts = ["# Theme Analysis Report\n\n"]
+        parts.append(f"Generated on: {vault_structure.root_path}\n\n")
         
         # Summary statistics
         total_notes = sum(len(results) for results in theme_groups.values())
-        analysis += f"## Summary\n\n"
-        analysis += f"- **Total Notes Processed**: {total_notes}\n"
-        analysis += f"- **Themes Identified**: {len(theme_groups)}\n"
-        analysis += f"- **Notes Curated**: {sum(len(results) for results in theme_groups.values() if results)}\n\n"
+        parts.append(f"## Summary\n\n")
+        parts.append(f"- **Total Notes Processed**: {total_notes}\n")
+        parts.append(f"- **Themes Identified**: {len(theme_groups)}\n")
+        parts.append(f"- **Notes Curated**: {sum(len(results) for results in theme_groups.values() if results)}\n\n")
         
         # Theme breakdown
-        analysis += "## Theme Breakdown\n\n"
+        parts.append("## Theme Breakdown\n\n")
         
         for theme_name, results in sorted(theme_groups.items()):
             if not results:
                 continue
                 
-            analysis += f"### {theme_name.replace('_', ' ').title()}\n\n"
-            analysis += f"- **Notes**: {len(results)}\n"
-            analysis += f"- **Percentage**: {(len(results) / total_notes * 100):.1f}%\n"
+            parts.append(f"### {theme_name.replace('_', ' ').title()}\n\n")
+            parts.append(f"- **Notes**: {len(results)}\n")
+            parts.append(f"- **Percentage**: {(len(results) / total_notes * 100):.1f}%\n")
             
             # Quality statistics
             if results:
                 avg_quality = sum(r.quality_scores.overall for r in results) / len(results)
                 avg_relevance = sum(r.quality_scores.relevance for r in results) / len(results)
-                analysis += f"- **Average Quality**: {avg_quality:.2f}\n"
-                analysis += f"- **Average Relevance**: {avg_relevance:.2f}\n"
+                parts.append(f"- **Average Quality**: {avg_quality:.2f}\n")
+                parts.append(f"- **Average Relevance**: {avg_relevance:.2f}\n")
             
-            analysis += "\n"
+            parts.append("\n")
             
             # Sample titles
-            sample_titles = [r.note.title for r in results[:5]]
-            analysis += f"**Sample Titles**:\n"
-            for title in sample_titles:
-                analysis += f"- {title}\n"
-            analysis += "\n"
+            parts.append(f"**Sample Titles**:\n")
+            for r in results[:5]:
+                parts.append(f"- {r.note.title}\n")
+            parts.append("\n")
         
-        return analysis
+        return "".join(parts)
     
     def suggest_theme_improvements(self, theme_groups: Dict[str, List[CurationResult]]) -> List[str]:
         """Suggest improvements for theme classification.
@@ -0,0 +1,97 @@
+"""Near-duplicate detection for note titles using MinHash and LSH."""
+
+import hashlib
+import random
+from typing import Dict, FrozenSet, List, Tuple
+
+# Mersenne prime used for the universal hash family
+_PRIME = (1 << 61) - 1
+# 16 bands of 4 rows put the LSH detection curve's knee near 0.5 similarity,
+# so candidates above the usual thresholds (0.7+) are almost never missed
+_BANDS = 16
+_ROWS = 4
+_NUM_PERM = _BANDS * _ROWS
+# Fixed seed so signatures are comparable across indexes
+_rng = random.Random(0x7117E)
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_NUM_PERM)
+)
+
+
+def title_shingles(title: str) -> FrozenSet[str]:
+    """Character trigrams of a (normalized) title.
+
+    Titles shorter than three characters are their own single shingle.
+    """
+    if len(title) < 3:
+        return frozenset((title,))
+    return frozenset(title[i:i + 3] for i in range(len(title) - 2))
+
+
+def _minhash(shingles: FrozenSet[str]) -> List[int]:
+    """MinHash signature of a shingle set."""
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+              for s in shingles]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+class NearDuplicateTitleIndex:
+    """Finds previously added titles whose trigram sets are similar.
+
+    Titles are MinHashed and bucketed by band (locality-sensitive hashing), so
+    a query only compares against titles sharing a bucket instead of every
+    title seen. Candidates are confirmed with their exact Jaccard similarity.
+    """
+
+    def __init__(self, threshold: float):
+        """Create an empty index.
+
+        Args:
+            threshold: Minimum Jaccard similarity of trigram sets for two
+                titles to count as near-duplicates
+        """
+        self.threshold = threshold
+        self._shingles: List[FrozenSet[str]] = []
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(_BANDS)]
+        self._last = None
+
+    def _signature(self, title: str) -> Tuple[FrozenSet[str], List[Tuple[int, ...]]]:
+        """Shingles and LSH bands of a title (the last one is memoized)."""
+        if self._last is not None and self._last[0] == title:
+            return self._last[1]
+        shingles = title_shingles(title)
+        signature = _minhash(shingles)
+        bands = [tuple(signature[i * _ROWS:(i + 1) * _ROWS]) for i in range(_BANDS)]
+        self._last = (title, (shingles, bands))
+        return shingles, bands
+
+    def contains_similar(self, title: str) -> bool:
+        """Check whether a near-duplicate of a title has been added.
+
+        Args:
+            title: Normalized title
+
+        Returns:
+            True if an added title reaches the similarity threshold
+        """
+        shingles, bands = self._signature(title)
+        candidates = set()
+        for bucket, band in zip(self._buckets, bands):
+            candidates.update(bucket.get(band, ()))
+        for candidate in candidates:
+            other = self._shingles[candidate]
+            if len(shingles & other) >= self.threshold * len(shingles | other):
+                return True
+        return False
+
+    def add(self, title: str) -> None:
+        """Index a title.
+
+        Args:
+            title: Normalized title
+        """
+        shingles, bands = self._signature(title)
+        index = len(self._shingles)
+        self._shingles.append(shingles)
+        for bucket, band in zip(self._buckets, bands):
+            bucket.setdefault(band, []).append(index)
@@ -1,14 +1,39 @@
 """Vault organization and file management for curated content."""
 
 import json
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from loguru import logger
 
 from .models import CurationResult, VaultStructure, CurationStats, CurationConfig
 
+# Upper bounds (exclusive) of the quality score buckets; scores at or above
+# the last edge fall into the final bucket
+_QUALITY_BUCKET_EDGES = (0.2, 0.4, 0.6, 0.8)
+_QUALITY_BUCKET_LABELS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+
+# Quality dimensions averaged in statistics.json
+_AVERAGED_SCORES = ("overall", "relevance", "completeness", "credibility", "clarity")
+
+
+def _bucket_quality_scores(results: List[CurationResult]) -> Dict[str, int]:
+    """Count results per overall quality score bucket.
+
+    Args:
+        results: Curation results to bucket
+
+    Returns:
+        Dictionary mapping each bucket label to its count
+    """
+    counts = [0] * len(_QUALITY_BUCKET_LABELS)
+    for result in results:
+        counts[bisect_right(_QUALITY_BUCKET_EDGES, result.quality_scores.overall)] += 1
+    return dict(zip(_QUALITY_BUCKET_LABELS, counts))
+
 
 class VaultOrganizer:
     """Organizes and saves curated content to a new vault structure."""
@@ -24,13 +49,16 @@ class VaultOrganizer:
     def create_curated_vault(self, 
                             curation_results: List[CurationResult], 
                             output_path: Path,
-                            vault_structure: VaultStructure) -> CurationStats:
+                            vault_structure: VaultStructure,
+                            theme_groups: Optional[Dict[str, List[CurationResult]]] = None) -> CurationStats:
         """Create the curated vault with organized content.
         
         Args:
             curation_results: List of curation results to organize
             output_path: Root path for the curated vault
             vault_structure: Vault structure information
+            theme_groups: Curated results already grouped by theme (classified
+                here if not given)
             
         Returns:
             CurationStats object with processing statistics
@@ -40,15 +68,18 @@ class VaultOrganizer:
         logger.info(f"Creating curated vault at: {output_path}")
         
         # Filter curated results
-        curated_results = [r for r in curation_results if r.is_curated]
-        rejected_results = [r for r in curation_results if not r.is_curated]
-        
-        # Create theme groups
-        from .theme_classifier import ThemeClassifier
-        theme_classifier = ThemeClassifier(
-            self.config.theme_similarity_threshold
-        )
-        theme_groups = theme_classifier.classify_themes(curated_results)
+        curated_results = []
+        rejected_results = []
+        for result in curation_results:
+            (curated_results if result.is_curated else rejected_results).append(result)
+        
+        # Create theme groups, unless the caller already has them
+        if theme_groups is None:
+            from .theme_classifier import ThemeClassifier
+            theme_classifier = ThemeClassifier(
+                self.config.theme_similarity_threshold
+            )
+            theme_groups = theme_classifier.classify_themes(curated_results)
         
         # Save curated notes to theme folders
         saved_notes = self._save_curated_notes(theme_groups, vault_structure)
@@ -85,7 +116,9 @@ class VaultOrganizer:
         Returns:
             Number of notes saved
         """
-        saved_count = 0
+        # Notes bound for the same file are saved in order by one worker, since
+        # each save compares against what is already on disk
+        save_jobs: Dict[Path, Tuple[Path, List[CurationResult]]] = {}
         
         for theme_name, results in theme_groups.items():
             if not results:
@@ -108,14 +141,32 @@ class VaultOrganizer:
                     # Store the created folder path for future use
                     vault_structure.theme_folders[theme_name] = folder_path
             
-            # Save notes to folder
+            # Queue notes for their folder
             for result in results:
-                try:
-                    self._save_note(result, folder_path)
-                    saved_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to save note {result.note.title}: {e}")
+                file_path = folder_path / f"{self._generate_filename(result.note.title)}.md"
+                save_jobs.setdefault(file_path, (folder_path, []))[1].append(result)
+        
+        # Writes are I/O-bound, so files are saved concurrently
+        with ThreadPoolExecutor(max_workers=self.config.write_workers) as executor:
+            return sum(executor.map(lambda job: self._save_notes_to_folder(*job), save_jobs.values()))
+    
+    def _save_notes_to_folder(self, folder_path: Path, results: List[CurationResult]) -> int:
+        """Save curated notes to a folder one after another.
         
+        Args:
+            folder_path: Folder to save the notes in
+            results: Curation results to save, in order
+            
+        Returns:
+            Number of notes saved
+        """
+        saved_count = 0
+        for result in results:
+            try:
+                self._save_note(result, folder_path)
+                saved_count += 1
+            except Exception as e:
+                logger.error(f"Failed to save note {result.note.title}: {e}")
         return saved_count
     
     def _save_note(self, result: CurationResult, folder_path: Path) -> None:
@@ -294,7 +345,7 @@ class VaultOrganizer:
         content.append("")
         
         # Clean and format the cleaned content
-        cleaned_content = result.cleaned_content.strip()
+        cleaned_content = result.content.strip()
         if cleaned_content:
             # Split into paragraphs and clean each one
             paragraphs = cleaned_content.split('\n\n')
@@ -351,79 +402,82 @@ class VaultOrganizer:
             rejected_results: Rejected results only
             vault_structure: Vault structure information
         """
-        log_content = []
-        
-        log_content.append("# Curation Log")
-        log_content.append("")
-        log_content.append(f"Generated on: {datetime.now().isoformat()}")
-        log_content.append(f"Configuration: {self.config.dict()}")
-        log_content.append("")
-        
-        # Summary
-        log_content.append("## Summary")
-        log_content.append("")
-        log_content.append(f"- **Total Notes Processed**: {len(all_results)}")
-        log_content.append(f"- **Notes Curated**: {len(curated_results)}")
-        log_content.append(f"- **Notes Rejected**: {len(rejected_results)}")
-        log_content.append(f"- **Curation Rate**: {(len(curated_results) / len(all_results) * 100):.1f}%")
-        log_content.append("")
-        
-        # Curated notes with full analytical metadata
-        log_content.append("## Curated Notes")
-        log_content.append("")
-        for result in curated_results:
-            log_content.append(f"### {result.note.title}")
-            log_content.append(f"- **File**: {result.note.file_path}")
-            log_content.append(f"- **Source**: {result.note.source_url or 'Unknown'}")
-            log_content.append(f"- **Content Type**: {result.note.content_type.value}")
-            log_content.append("")
+        # Stream the log straight to disk; each block opens with the blank line
+        # that separates it from the previous one
+        with vault_structure.curation_log_path.open('w', encoding='utf-8') as f:
+            write = f.write
+            write(
+                "# Curation Log\n"
+                "\n"
+                f"Generated on: {datetime.now().isoformat()}\n"
+                f"Configuration: {self.config.dict()}\n"
+                "\n"
+                "## Summary\n"
+                "\n"
+                f"- **Total Notes Processed**: {len(all_results)}\n"
+                f"- **Notes Curated**: {len(curated_results)}\n"
+                f"- **Notes Rejected**: {len(rejected_results)}\n"
+                f"- **Curation Rate**: {(len(curated_results) / len(all_results) * 100):.1f}%\n"
+                "\n"
+                "## Curated Notes\n"
+            )
             
-            # Quality Scores
-            log_content.append("**Quality Assessment:**")
-            log_content.append(f"- Overall: {result.quality_scores.overall:.2f}")
-            log_content.append(f"- Relevance: {result.quality_scores.relevance:.2f}")
-            log_content.append(f"- Analytical Depth: {result.quality_scores.analytical_depth:.2f}")
-            log_content.append(f"- Critical Thinking: {result.quality_scores.critical_thinking:.2f}")
-            log_content.append(f"- Evidence Quality: {result.quality_scores.evidence_quality:.2f}")
-            log_content.append(f"- Argument Structure: {result.quality_scores.argument_structure:.2f}")
-            log_content.append(f"- Practical Value: {result.quality_scores.practical_value:.2f}")
-            log_content.append("")
-            
-            # Themes
-            if result.themes:
-                log_content.append("**Identified Themes:**")
-                for theme in result.themes:
-                    log_content.append(f"- {theme.name} (confidence: {theme.confidence:.2f}, expertise: {theme.expertise_level}, category: {theme.content_category})")
-                log_content.append("")
-            
-            # Content Structure
-            if result.content_structure:
-                log_content.append("**Content Structure:**")
-                log_content.append(f"- Clear Problem: {result.content_structure.has_clear_problem}")
-                log_content.append(f"- Has Evidence: {result.content_structure.has_evidence}")
-                log_content.append(f"- Multiple Perspectives: {result.content_structure.has_multiple_perspectives}")
-                log_content.append(f"- Actionable Conclusions: {result.content_structure.has_actionable_conclusions}")
-                log_content.append(f"- Logical Flow: {result.content_structure.logical_flow_score:.2f}")
-                log_content.append("")
+            # Curated notes with full analytical metadata
+            for result in curated_results:
+                scores = result.quality_scores
+                write(
+                    f"\n### {result.note.title}\n"
+                    f"- **File**: {result.note.file_path}\n"
+                    f"- **Source**: {result.note.source_url or 'Unknown'}\n"
+                    f"- **Content Type**: {result.note.content_type.value}\n"
+                    "\n"
+                    "**Quality Assessment:**\n"
+                    f"- Overall: {scores.overall:.2f}\n"
+                    f"- Relevance: {scores.relevance:.2f}\n"
+                    f"- Analytical Depth: {scores.analytical_depth:.2f}\n"
+                    f"- Critical Thinking: {scores.critical_thinking:.2f}\n"
+                    f"- Evidence Quality: {scores.evidence_quality:.2f}\n"
+                    f"- Argument Structure: {scores.argument_structure:.2f}\n"
+                    f"- Practical Value: {scores.practical_value:.2f}\n"
+                    "\n"
+                )
+                
+                # Themes
+                if result.themes:
+                    write("**Identified Themes:**\n")
+                    for theme in result.themes:
+                        write(f"- {theme.name} (confidence: {theme.confidence:.2f}, expertise: {theme.expertise_level}, category: {theme.content_category})\n")
+                    write("\n")
+                
+                # Content Structure
+                structure = result.content_structure
+                if structure:
+                    write(
+                        "**Content Structure:**\n"
+                        f"- Clear Problem: {structure.has_clear_problem}\n"
+                        f"- Has Evidence: {structure.has_evidence}\n"
+                        f"- Multiple Perspectives: {structure.has_multiple_perspectives}\n"
+                        f"- Actionable Conclusions: {structure.has_actionable_conclusions}\n"
+                        f"- Logical Flow: {structure.logical_flow_score:.2f}\n"
+                        "\n"
+                    )
+                
+                write(f"- **Curation Reason**: {result.curation_reason}\n")
             
-            log_content.append(f"- **Curation Reason**: {result.curation_reason}")
-            log_content.append("")
-        
-        # Rejected notes
-        if rejected_results:
-            log_content.append("## Rejected Notes")
-            log_content.append("")
-            for result in rejected_results:
-                log_content.append(f"### {result.note.title}")
-                log_content.append(f"- **File**: {result.note.file_path}")
-                log_content.append(f"- **Quality**: {result.quality_scores.overall:.2f}")
-                log_content.append(f"- **Relevance**: {result.quality_scores.relevance:.2f}")
-                log_content.append(f"- **Analytical Depth**: {result.quality_scores.analytical_depth:.2f}")
-                log_content.append(f"- **Critical Thinking**: {result.quality_scores.critical_thinking:.2f}")
-                log_content.append(f"- **Reason**: {result.curation_reason}")
-                log_content.append("")
-        
-        vault_structure.curation_log_path.write_text("\n".join(log_content), encoding='utf-8')
+            # Rejected notes
+            if rejected_results:
+                write("\n## Rejected Notes\n")
+                for result in rejected_results:
+                    scores = result.quality_scores
+                    write(
+                        f"\n### {result.note.title}\n"
+                        f"- **File**: {result.note.file_path}\n"
+                        f"- **Quality**: {scores.overall:.2f}\n"
+                        f"- **Relevance**: {scores.relevance:.2f}\n"
+                        f"- **Analytical Depth**: {scores.analytical_depth:.2f}\n"
+                        f"- **Critical Thinking**: {scores.critical_thinking:.2f}\n"
+                        f"- **Reason**: {result.curation_reason}\n"
+                    )
     
     def _save_configuration(self, vault_structure: VaultStructure) -> None:
         """Save configuration file to the vault.
@@ -459,23 +513,14 @@ class VaultOrganizer:
         """
         stats_path = vault_structure.metadata_folder / "statistics.json"
         
-        # Calculate quality distributions
-        quality_ranges = {
-            "0.0-0.2": 0, "0.2-0.4": 0, "0.4-0.6": 0, "0.6-0.8": 0, "0.8-1.0": 0
-        }
-        
+        # Bucket and total the scores in a single pass over the results
+        bucket_counts = [0] * len(_QUALITY_BUCKET_LABELS)
+        score_totals = dict.fromkeys(_AVERAGED_SCORES, 0.0)
         for result in all_results:
-            score = result.quality_scores.overall
-            if score < 0.2:
-                quality_ranges["0.0-0.2"] += 1
-            elif score < 0.4:
-                quality_ranges["0.2-0.4"] += 1
-            elif score < 0.6:
-                quality_ranges["0.4-0.6"] += 1
-            elif score < 0.8:
-                quality_ranges["0.6-0.8"] += 1
-            else:
-                quality_ranges["0.8-1.0"] += 1
+            scores = result.quality_scores
+            bucket_counts[bisect_right(_QUALITY_BUCKET_EDGES, scores.overall)] += 1
+            for name in _AVERAGED_SCORES:
+                score_totals[name] += getattr(scores, name)
         
         stats_data = {
             "summary": {
@@ -484,13 +529,10 @@ class VaultOrganizer:
                 "rejected_notes": len(rejected_results),
                 "curation_rate": len(curated_results) / len(all_results) if all_results else 0
             },
-            "quality_distribution": quality_ranges,
+            "quality_distribution": dict(zip(_QUALITY_BUCKET_LABELS, bucket_counts)),
             "average_scores": {
-                "overall": sum(r.quality_scores.overall for r in all_results) / len(all_results) if all_results else 0,
-                "relevance": sum(r.quality_scores.relevance for r in all_results) / len(all_results) if all_results else 0,
-                "completeness": sum(r.quality_scores.completeness for r in all_results) / len(all_results) if all_results else 0,
-                "credibility": sum(r.quality_scores.credibility for r in all_results) / len(all_results) if all_results else 0,
-                "clarity": sum(r.quality_scores.clarity for r in all_results) / len(all_results) if all_results else 0
+                name: total / len(all_results) if all_results else 0
+                for name, total in score_totals.items()
             },
             "generated_date": datetime.now().isoformat()
         }
@@ -506,21 +548,4 @@ class VaultOrganizer:
         Returns:
             Dictionary with quality score ranges and counts
         """
-        distribution = {
-            "0.0-0.2": 0, "0.2-0.4": 0, "0.4-0.6": 0, "0.6-0.8": 0, "0.8-1.0": 0
-        }
-        
-        for result in results:
-            score = result.quality_scores.overall
-            if score < 0.2:
-                distribution["0.0-0.2"] += 1
-            elif score < 0.4:
-                distribution["0.2-0.4"] += 1
-            elif score < 0.6:
-                distribution["0.4-0.6"] += 1
-            elif score < 0.8:
-                distribution["0.6-0.8"] += 1
-            else:
-                distribution["0.8-1.0"] += 1
-        
-        return distribution
+        return _bucket_quality_scores(results)
@@ -0,0 +1,115 @@
+from itertools import count
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import ollama
+
+from obsidian_curator import analysis_cache as analysis_cache_module
+from obsidian_curator.analysis_cache import AnalysisCache, SemanticAnalysisCache, used_fallback
+from obsidian_curator.core import ObsidianCurator
+from obsidian_curator.models import (
+    ContentStructure,
+    ContentType,
+    CurationConfig,
+    Note,
+    QualityScore,
+    Theme,
+)
+
+
+def make_note(title: str, content: str = "Body text about infrastructure financing. ") -> Note:
+    return Note(
+        file_path=Path(f"{title}.md"),
+        title=title,
+        content=content * 10,
+        content_type=ContentType.PERSONAL_NOTE,
+    )
+
+
+def make_analysis(score: float = 0.7):
+    quality = QualityScore(overall=score, relevance=score, completeness=score,
+                           credibility=score, clarity=score)
+    structure = ContentStructure(has_clear_problem=True, has_evidence=False,
+                                 has_multiple_perspectives=False, has_actionable_conclusions=True,
+                                 logical_flow_score=0.6, argument_coherence=0.6, conclusion_strength=0.6)
+    return quality, [Theme(name="infrastructure", confidence=0.9)], structure, "Substantial content"
+
+
+def test_analysis_cache_round_trips_entries(tmp_path: Path) -> None:
+    note = make_note("a")
+    cache = AnalysisCache(tmp_path, "models-v1")
+    cache.set(note, make_analysis())
+    cache.close()
+
+    cache = AnalysisCache(tmp_path, "models-v1")
+    assert cache.get(note) == make_analysis()
+    assert cache.get(make_note("b", "Other content. ")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
+def test_analysis_cache_misses_after_fingerprint_change(tmp_path: Path) -> None:
+    note = make_note("a")
+    cache = AnalysisCache(tmp_path, "models-v1")
+    cache.set(note, make_analysis())
+    cache.close()
+
+    cache = AnalysisCache(tmp_path, "models-v2")
+    assert cache.get(note) is None
+    cache.close()
+
+
+def test_analysis_cache_evicts_least_recently_used_on_close(tmp_path: Path, monkeypatch) -> None:
+    clock = count()
+    monkeypatch.setattr(analysis_cache_module.time, "time", lambda: float(next(clock)))
+    notes = [make_note(name, f"Content of note {name}. ") for name in "abc"]
+
+    cache = AnalysisCache(tmp_path, "models-v1", max_entries=2)
+    for note in notes:
+        cache.set(note, make_analysis())
+    cache.get(notes[0])  # "a" is now more recently used than "b"
+    cache.close()
+
+    cache = AnalysisCache(tmp_path, "models-v1")
+    assert cache.get(notes[0]) is not None
+    assert cache.get(notes[1]) is None
+    assert cache.get(notes[2]) is not None
+    cache.close()
+
+
+def test_semantic_cache_keeps_only_newest_entries(tmp_path: Path, monkeypatch) -> None:
+    clock = count()
+    monkeypatch.setattr(analysis_cache_module.time, "time", lambda: float(next(clock)))
+    notes = [make_note(name, f"Content of note {name}. ") for name in "abc"]
+    vectors = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
+    cache = SemanticAnalysisCache(tmp_path, "models-v1", "embedder", 0.9, max_entries=2)
+    for note, vector in zip(notes, vectors):
+        cache.set(note, vector, make_analysis())
+    cache.close()
+
+    cache = SemanticAnalysisCache(tmp_path, "models-v1", "embedder", 0.9, max_entries=2)
+    assert cache.get(notes[0], vectors[0]) is None
+    assert cache.get(notes[1], vectors[1]) == make_analysis()
+    assert cache.get(notes[2], vectors[2]) == make_analysis()
+    cache.close()
+
+
+def test_fallback_analyses_are_not_cached(tmp_path: Path, monkeypatch) -> None:
+    def unavailable(**kwargs):
+        raise ConnectionError("model server down")
+
+    monkeypatch.setattr(ollama, "list", lambda: {"models": []})
+    monkeypatch.setattr(ollama, "chat", unavailable)
+    curator = ObsidianCurator(CurationConfig(cache_dir=tmp_path))
+    cache = AnalysisCache(tmp_path, "models-v1")
+    note = make_note("a")
+
+    result = curator._analyze_note_batch([note], cache)[0]
+
+    assert used_fallback((result.quality_scores, result.themes,
+                          result.content_structure, result.curation_reason))
+    assert cache.get(note) is None
+    cache.close()
@@ -0,0 +1,33 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from obsidian_curator.content_processor import ContentProcessor
+from obsidian_curator.models import ContentType
+
+
+def test_process_notes_keeps_order_and_skips_failures(tmp_path: Path) -> None:
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"note{i}.md"
+        path.write_text(f"# Note {i}\n\nSome body text for note {i}.")
+        paths.append(path)
+    paths.insert(2, tmp_path / "missing.md")
+
+    processor = ContentProcessor(extract_linked_content=False)
+    notes = processor.process_notes(paths, max_workers=2)
+
+    assert [note.title for note in notes] == ["Note 0", "Note 1", "Note 2", "Note 3"]
+
+
+def test_min_content_chars_keeps_voice_memo_with_frontmatter(tmp_path: Path) -> None:
+    path = tmp_path / "memo.md"
+    path.write_text("---\ntags: voice\ncreated: 2024-01-01\n---\n"
+                    "![[attachments/Recording 20240101.docx]]")
+
+    processor = ContentProcessor(extract_linked_content=False)
+    note = processor.process_note(path, min_content_chars=100)
+
+    assert note is not None
+    assert note.content_type == ContentType.AUDIO_ANNOTATION
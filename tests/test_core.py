@@ -0,0 +1,48 @@
+from pathlib import Path
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import ollama
+
+from obsidian_curator.core import ObsidianCurator
+from obsidian_curator.models import (
+    Note,
+    ContentType,
+    QualityScore,
+    Theme,
+    CurationResult,
+    CurationConfig,
+)
+
+
+def make_result(title: str, is_curated: bool) -> CurationResult:
+    note = Note(
+        file_path=Path(f"{title}.md"),
+        title=title,
+        content="text",
+        content_type=ContentType.PERSONAL_NOTE,
+    )
+    quality = QualityScore(overall=0.8, relevance=0.8, completeness=0.8, credibility=0.8, clarity=0.8)
+    return CurationResult(
+        note=note,
+        quality_scores=quality,
+        themes=[Theme(name="test", confidence=1.0)],
+        is_curated=is_curated,
+        curation_reason="",
+    )
+
+
+def test_curated_vault_records_decisions_of_every_batch(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ollama, "list", lambda: {"models": []})
+    curator = ObsidianCurator(CurationConfig(cache_dir=tmp_path / "cache"))
+    # Only the last batch's temporary vault is moved into place
+    curator._temp_output_path = tmp_path / "temp_curated_vault_2"
+    curator._temp_output_path.mkdir()
+    results = [make_result("first batch", True), make_result("second batch", False)]
+
+    curator._create_curated_vault(results, tmp_path / "vault")
+
+    lines = (tmp_path / "vault" / "metadata" / "curation_decisions.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["first batch", "second batch"]
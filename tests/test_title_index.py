@@ -0,0 +1,14 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from obsidian_curator.title_index import NearDuplicateTitleIndex
+
+
+def test_title_index_matches_near_duplicate_titles() -> None:
+    index = NearDuplicateTitleIndex(threshold=0.7)
+    index.add("how large language models work")
+
+    assert index.contains_similar("how large language models work part 1")
+    assert not index.contains_similar("water infrastructure financing")